@@ -99,6 +99,16 @@ class TestToolRegistry:
         tools = reg.list(max_risk=ToolRisk.SHELL)
         assert len(tools) == 4
 
+    def test_list_with_risk_level_exact(self):
+        reg = ToolRegistry()
+        reg.register(EchoTool())
+        reg.register(WriteTool())
+        reg.register(DestructiveTool())
+        reg.register(ShellTool())
+        tools = reg.list(risk_level=ToolRisk.WRITE)
+        assert [t.risk_level for t in tools] == [ToolRisk.WRITE]
+        assert reg.list(max_risk=ToolRisk.READ_ONLY, risk_level=ToolRisk.SHELL) == []
+
     def test_to_openai_schema(self):
         reg = ToolRegistry()
         reg.register(EchoTool())
@@ -4,6 +4,7 @@ Tests for session store, events, context packing, and the Session manager.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import tempfile
 import uuid
@@ -223,6 +224,53 @@ class TestSessionStore:
         assert len(user_events) == 2
         assert all(e.event_type == EVENT_USER_MESSAGE for e in user_events)
 
+    async def test_get_events_limit_returns_latest(self, store: SessionStore):
+        sid = await store.create_session()
+        for i in range(5):
+            await store.append_event(sid, user_message_event("t1", f"msg-{i}"))
+
+        events = await store.get_events(sid, limit=2)
+        assert [e.payload["content"] for e in events] == ["msg-3", "msg-4"]
+
+    async def test_get_events_after_event_id(self, store: SessionStore):
+        sid = await store.create_session()
+        appended = [user_message_event("t1", f"msg-{i}") for i in range(4)]
+        for ev in appended:
+            await store.append_event(sid, ev)
+
+        events = await store.get_events(sid, after_event_id=appended[1].event_id)
+        assert [e.payload["content"] for e in events] == ["msg-2", "msg-3"]
+
+        assert await store.get_events(sid, after_event_id=appended[-1].event_id) == []
+        # An unknown cursor falls back to the full history
+        assert len(await store.get_events(sid, after_event_id="missing")) == 4
+
+    async def test_tail_events_follows_appends(self, store: SessionStore):
+        sid = await store.create_session()
+        first = user_message_event("t1", "before")
+        await store.append_event(sid, first)
+
+        seen: list[str] = []
+
+        async def follow() -> None:
+            async for ev in store.tail_events(sid, poll_interval=0.01):
+                seen.append(ev.payload["content"])
+                if len(seen) == 3:
+                    return
+
+        task = asyncio.create_task(follow())
+        await asyncio.sleep(0.05)
+        assert seen == ["before"]
+        await store.append_event(sid, user_message_event("t1", "after-1"))
+        await store.append_event(sid, user_message_event("t1", "after-2"))
+        await asyncio.wait_for(task, timeout=2)
+        assert seen == ["before", "after-1", "after-2"]
+
+        # Starting from a known event skips everything up to it
+        tail = store.tail_events(sid, after_event_id=first.event_id, poll_interval=0.01)
+        assert (await anext(tail)).payload["content"] == "after-1"
+        await tail.aclose()
+
     async def test_multiple_sessions_isolated(self, store: SessionStore):
         sid1 = await store.create_session()
         sid2 = await store.create_session()
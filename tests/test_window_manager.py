@@ -0,0 +1,65 @@
+"""Tests for window stacking in the TUI window manager."""
+
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from workbench.tui.app import WorkbenchApp
+from workbench.tui.window import Window
+from workbench.tui.window_manager import WindowManager
+
+
+class _StackingApp(App):
+    # The real app's CSS, so its Screen layer list is what gets resolved
+    DEFAULT_CSS = WorkbenchApp.DEFAULT_CSS
+
+    def compose(self) -> ComposeResult:
+        yield WindowManager()
+
+
+def _window_at(app: App, x: int, y: int) -> Window | None:
+    widget, _ = app.screen.get_widget_at(x, y)
+    for node in widget.ancestors_with_self:
+        if isinstance(node, Window):
+            return node
+    return None
+
+
+async def _open_overlapping(pilot) -> WindowManager:
+    wm = pilot.app.query_one(WindowManager)
+    for i in range(3):
+        wm.open_window(Window(Static(f"w{i}"), title=f"w{i}", id=f"w{i}"), offset=(i * 4, i * 2))
+    await pilot.pause()
+    return wm
+
+
+async def test_last_opened_window_is_on_top():
+    async with _StackingApp().run_test(size=(120, 40)) as pilot:
+        await _open_overlapping(pilot)
+        assert _window_at(pilot.app, 12, 6).id == "w2"
+
+
+async def test_bring_to_front_raises_window_over_overlap():
+    async with _StackingApp().run_test(size=(120, 40)) as pilot:
+        wm = await _open_overlapping(pilot)
+        wm.bring_to_front("w0")
+        await pilot.pause()
+        assert _window_at(pilot.app, 12, 6).id == "w0"
+        wm.bring_to_front("w1")
+        await pilot.pause()
+        assert _window_at(pilot.app, 12, 6).id == "w1"
+        assert wm.active_window.id == "w1"
+
+
+async def test_bring_to_front_after_layers_compact():
+    async with _StackingApp().run_test(size=(120, 40)) as pilot:
+        wm = await _open_overlapping(pilot)
+        # Enough raises to run through every numbered layer at least once
+        for i in range(150):
+            wm.bring_to_front(f"w{i % 3}")
+        await pilot.pause()
+        assert _window_at(pilot.app, 12, 6).id == "w2"
+        wm.bring_to_front("w0")
+        await pilot.pause()
+        assert _window_at(pilot.app, 12, 6).id == "w0"
@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import json
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -246,29 +247,45 @@ class SessionStore:
         self,
         session_id: str,
         event_type: str | None = None,
+        *,
+        limit: int | None = None,
+        after_event_id: str | None = None,
     ) -> list[SessionEvent]:
         """
         Return events for a session in chronological order.
 
-        Optionally filter by ``event_type``.
+        Optionally filter by ``event_type``.  ``after_event_id`` returns
+        only events appended after that event (all events if it is
+        unknown), and ``limit`` keeps only the most recent ``limit``
+        matches; both are applied in SQL.
         """
         assert self._db is not None
+        where = "session_id = ?"
+        params: list[str | int] = [session_id]
         if event_type is not None:
-            cursor = await self._db.execute(
-                """SELECT event_id, turn_id, event_type, timestamp, payload
+            where += " AND event_type = ?"
+            params.append(event_type)
+        if after_event_id is not None:
+            where += " AND id > COALESCE((SELECT id FROM events WHERE event_id = ?), 0)"
+            params.append(after_event_id)
+
+        if limit is None:
+            query = f"""SELECT event_id, turn_id, event_type, timestamp, payload
                    FROM events
-                   WHERE session_id = ? AND event_type = ?
-                   ORDER BY id ASC""",
-                (session_id, event_type),
-            )
+                   WHERE {where}
+                   ORDER BY id ASC"""
         else:
-            cursor = await self._db.execute(
-                """SELECT event_id, turn_id, event_type, timestamp, payload
-                   FROM events
-                   WHERE session_id = ?
-                   ORDER BY id ASC""",
-                (session_id,),
-            )
+            # Take the newest rows, then put them back in chronological order
+            query = f"""SELECT event_id, turn_id, event_type, timestamp, payload
+                   FROM (SELECT id, event_id, turn_id, event_type, timestamp, payload
+                         FROM events
+                         WHERE {where}
+                         ORDER BY id DESC
+                         LIMIT ?)
+                   ORDER BY id ASC"""
+            params.append(limit)
+
+        cursor = await self._db.execute(query, params)
         rows = await cursor.fetchall()
         events: list[SessionEvent] = []
         for row in rows:
@@ -283,6 +300,28 @@ class SessionStore:
             )
         return events
 
+    async def tail_events(
+        self,
+        session_id: str,
+        *,
+        after_event_id: str | None = None,
+        poll_interval: float = 0.5,
+    ) -> AsyncIterator[SessionEvent]:
+        """
+        Yield events for a session as they are appended.
+
+        Starts after ``after_event_id`` (or at the first event) and then
+        polls every ``poll_interval`` seconds, fetching only rows newer
+        than the last one yielded.  Ends once the store is closed.
+        """
+        while self._db is not None:
+            events = await self.get_events(session_id, after_event_id=after_event_id)
+            for ev in events:
+                after_event_id = ev.event_id
+                yield ev
+            if not events:
+                await asyncio.sleep(poll_interval)
+
     async def get_schema_version(self) -> int:
         """Public accessor for the current schema version."""
         return await self._get_schema_version()
@@ -24,14 +24,18 @@ class ToolRegistry:
             raise KeyError(name)
         return t
 
-    def list(self, max_risk: ToolRisk | None = None) -> list[Tool]:
+    def list(
+        self,
+        max_risk: ToolRisk | None = None,
+        *,
+        risk_level: ToolRisk | None = None,
+    ) -> list[Tool]:
         tools = list(self._tools.values())
-        if max_risk is None:
-            return sorted(tools, key=lambda t: t.name)
-        return sorted(
-            [t for t in tools if t.risk_level <= max_risk],
-            key=lambda t: t.name,
-        )
+        if max_risk is not None:
+            tools = [t for t in tools if t.risk_level <= max_risk]
+        if risk_level is not None:
+            tools = [t for t in tools if t.risk_level == risk_level]
+        return sorted(tools, key=lambda t: t.name)
 
     def to_openai_schema(self) -> list[dict]:
         return [t.to_openai_schema() for t in self.list()]
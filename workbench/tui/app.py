@@ -42,7 +42,7 @@ from workbench.llm.types import ToolCall
 from workbench.tui.context_menu import ContextMenu, MenuItem
 from workbench.tui.menu_bar import MenuBar, MenuSection, MenuAction
 from workbench.tui.window import Window, WindowState
-from workbench.tui.window_manager import WindowManager, WindowKind
+from workbench.tui.window_manager import WINDOW_SYSTEM_CSS, WindowManager, WindowKind
 from workbench.tui.windows.chat_window import ChatWindowContent
 from workbench.tui.windows.events_window import EventsWindowContent
 from workbench.tui.windows.tools_window import ToolsWindowContent
@@ -148,9 +148,8 @@ class WorkbenchApp(App):
         Binding("f10", "context_menu", "Menu"),
     ]
 
-    DEFAULT_CSS = """
+    DEFAULT_CSS = WINDOW_SYSTEM_CSS + """
     Screen {
-        layers: default windows context-menu menu-dropdown;
         background: #0d0d0d;
     }
 
@@ -349,7 +348,7 @@ class WorkbenchApp(App):
                     import base64
                     encoded = base64.b64encode(content._last_response.encode()).decode()
                     self._driver.write(f"\x1b]52;c;{encoded}\x07")
-                    log = content.query_one("#chat-log")
+                    log = content._chat_log
                     log.write(f"[green]Copied to clipboard + {copy_file}[/green]")
                     _log.info("Response copied (%d chars)", len(content._last_response))
             except Exception as e:
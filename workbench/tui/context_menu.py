@@ -19,9 +19,8 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
-import inspect
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from typing import Awaitable, Callable
 
 from textual import events, on
@@ -37,7 +36,7 @@ from textual.widgets import Static
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class MenuItem:
     """A single item in a context menu.
 
@@ -55,12 +54,26 @@ class MenuItem:
     hotkey_hint: str = ""
     disabled: bool = False
     separator: bool = False
+    _is_async: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Resolved once here so selection doesn't pay for the introspection.
+        if self.callback is not None:
+            from inspect import iscoroutinefunction
+
+            self._is_async = iscoroutinefunction(self.callback)
 
 
 # ---------------------------------------------------------------------------
 # Internal row widgets
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=64)
+def _sep_line(width: int) -> str:
+    """Return the divider string for *width*, shared across separators."""
+    return "\u2500" * max(width, 1)
+
+
 class _MenuSeparator(Static):
     """Horizontal divider rendered as a line of box-drawing characters."""
 
@@ -73,12 +86,16 @@ class _MenuSeparator(Static):
     """
 
     def __init__(self, width: int) -> None:
-        super().__init__("\u2500" * max(width, 1))
+        super().__init__(_sep_line(width))
 
 
 class _MenuItemRow(Static):
     """A selectable menu row showing label and optional hotkey hint."""
 
+    # Static does not declare __slots__, so instances keep a __dict__ for the
+    # base-class state; the row's own fields still go through slot descriptors.
+    __slots__ = ("_index", "_item")
+
     DEFAULT_CSS = """
     _MenuItemRow {
         height: 1;
@@ -105,27 +122,16 @@ class _MenuItemRow(Static):
     def __init__(
         self,
         item: MenuItem,
-        row_width: int,
+        rendered: str,
         index: int,
     ) -> None:
         self._item = item
         self._index = index
-        self._row_width = row_width
         super().__init__(
-            self._format_text(),
+            rendered,
             classes="--disabled" if item.disabled else "",
         )
 
-    def _format_text(self) -> str:
-        """Build the row text: label left-aligned, hotkey_hint right-aligned."""
-        label = self._item.label
-        hint = self._item.hotkey_hint
-        if hint:
-            # Pad between label and hint so total equals row_width.
-            gap = max(self._row_width - len(label) - len(hint), 2)
-            return f"{label}{' ' * gap}{hint}"
-        return label
-
     @property
     def item(self) -> MenuItem:
         return self._item
@@ -159,12 +165,12 @@ class ContextMenu(Widget):
     ALLOW_FOCUS = True
     can_focus = True
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("up", "cursor_up", "Up", show=False),
         Binding("down", "cursor_down", "Down", show=False),
         Binding("enter", "select", "Select", show=False),
         Binding("escape", "close", "Close", show=False),
-    ]
+    )
 
     DEFAULT_CSS = """
     ContextMenu {
@@ -215,45 +221,57 @@ class ContextMenu(Widget):
         super().__init__(name=name, id=id, classes=classes)
         self._items = list(items)
         self._position = position
-        # Build the list of selectable (non-separator, non-disabled) indices.
-        self._selectable_indices: list[int] = [
-            i
-            for i, item in enumerate(self._items)
-            if not item.separator and not item.disabled
-        ]
-        self._row_widgets: list[_MenuItemRow] = []
-        self._content_width = self._compute_width()
-
-    # -- Layout helpers -----------------------------------------------------
-
-    def _compute_width(self) -> int:
-        """Calculate the inner content width based on item labels and hints."""
-        widths: list[int] = []
-        for item in self._items:
+        # Single pass over the items: collect selectable (non-separator,
+        # non-disabled) indices and the widest label + hint.
+        selectable_indices: list[int] = []
+        add_selectable = selectable_indices.append
+        _len = len
+        content_width = -1
+        for i, item in enumerate(self._items):
             if item.separator:
                 continue
-            w = len(item.label)
-            if item.hotkey_hint:
+            if not item.disabled:
+                add_selectable(i)
+            w = _len(item.label)
+            hint = item.hotkey_hint
+            if hint:
                 # label + minimum_gap(2) + hint
-                w += 2 + len(item.hotkey_hint)
-            widths.append(w)
-        return max(widths, default=10)
+                w += 2 + _len(hint)
+            if w > content_width:
+                content_width = w
+        self._selectable_indices = selectable_indices
+        # Item index -> position in _selectable_indices, so the cursor
+        # position can be resynchronised in O(1) after mouse selection.
+        self._index_to_selectable_pos: dict[int, int] = {
+            idx: pos for pos, idx in enumerate(selectable_indices)
+        }
+        self._selectable_pos: int = 0
+        # Item index -> row widget, for O(1) highlight updates.
+        self._rows_by_index: dict[int, _MenuItemRow] = {}
+        self._content_width = content_width if content_width >= 0 else 10
+        self._dismissed = False
 
     # -- Compose ------------------------------------------------------------
 
     def compose(self) -> ComposeResult:
         """Build the menu rows."""
+        row_width = self._content_width
         for i, item in enumerate(self._items):
             if item.separator:
-                yield _MenuSeparator(self._content_width)
+                yield _MenuSeparator(row_width)
+                continue
+            # Row text: label left-aligned, hotkey_hint right-aligned.
+            label = item.label
+            hint = item.hotkey_hint
+            if hint:
+                # Pad between label and hint so total equals row_width
+                # (with a minimum gap of 2).
+                rendered = label.ljust(max(row_width - len(hint), len(label) + 2)) + hint
             else:
-                row = _MenuItemRow(
-                    item=item,
-                    row_width=self._content_width,
-                    index=i,
-                )
-                self._row_widgets.append(row)
-                yield row
+                rendered = label
+            row = _MenuItemRow(item=item, rendered=rendered, index=i)
+            self._rows_by_index[i] = row
+            yield row
 
     # -- Lifecycle ----------------------------------------------------------
 
@@ -266,6 +284,7 @@ class ContextMenu(Widget):
 
         # Set initial highlight to the first selectable item.
         if self._selectable_indices:
+            self._selectable_pos = 0
             self.highlight_index = self._selectable_indices[0]
 
         self.focus()
@@ -274,20 +293,26 @@ class ContextMenu(Widget):
 
     def watch_highlight_index(self, old: int, new: int) -> None:
         """Update CSS classes when the highlight moves."""
-        for row in self._row_widgets:
-            if row.index == old:
-                row.remove_class("--highlighted")
-            if row.index == new:
-                row.add_class("--highlighted")
-                # Scroll the highlighted row into view if needed.
-                self.scroll_visible(row, animate=False)
+        if old == new:
+            return
+        pos = self._index_to_selectable_pos.get(new)
+        if pos is not None:
+            self._selectable_pos = pos
+        old_row = self._rows_by_index.get(old)
+        new_row = self._rows_by_index.get(new)
+        if old_row is None and new_row is None:
+            return
+        if old_row is not None:
+            old_row.remove_class("--highlighted")
+        if new_row is not None:
+            new_row.add_class("--highlighted")
+            # Scroll the highlighted row into view only if it is off-screen.
+            if not self.scrollable_content_region.contains_region(new_row.region):
+                self.scroll_to_widget(new_row, animate=False)
 
     def _row_for_index(self, index: int) -> _MenuItemRow | None:
         """Return the row widget for a given item index, or None."""
-        for row in self._row_widgets:
-            if row.index == index:
-                return row
-        return None
+        return self._rows_by_index.get(index)
 
     # -- Keyboard actions ---------------------------------------------------
 
@@ -295,23 +320,15 @@ class ContextMenu(Widget):
         """Move highlight to the previous selectable item."""
         if not self._selectable_indices:
             return
-        try:
-            pos = self._selectable_indices.index(self.highlight_index)
-        except ValueError:
-            pos = 0
-        new_pos = (pos - 1) % len(self._selectable_indices)
-        self.highlight_index = self._selectable_indices[new_pos]
+        self._selectable_pos = (self._selectable_pos - 1) % len(self._selectable_indices)
+        self.highlight_index = self._selectable_indices[self._selectable_pos]
 
     def action_cursor_down(self) -> None:
         """Move highlight to the next selectable item."""
         if not self._selectable_indices:
             return
-        try:
-            pos = self._selectable_indices.index(self.highlight_index)
-        except ValueError:
-            pos = -1
-        new_pos = (pos + 1) % len(self._selectable_indices)
-        self.highlight_index = self._selectable_indices[new_pos]
+        self._selectable_pos = (self._selectable_pos + 1) % len(self._selectable_indices)
+        self.highlight_index = self._selectable_indices[self._selectable_pos]
 
     def action_select(self) -> None:
         """Select the currently highlighted item."""
@@ -334,7 +351,7 @@ class ContextMenu(Widget):
         # Prevent the click from propagating and closing via the blur handler.
         event.stop()
 
-        # Walk up from the clicked widget to find the _MenuItemRow.
+        # Rows have no children, so a click on an item lands on the row itself.
         target = event.widget
         if isinstance(target, _MenuItemRow):
             item = target.item
@@ -354,13 +371,17 @@ class ContextMenu(Widget):
         self._dismiss()
 
         if item.callback is not None:
-            if inspect.iscoroutinefunction(item.callback):
-                # Schedule the async callback on the running event loop.
-                asyncio.ensure_future(item.callback())
+            if item._is_async:
+                # Let the app's message loop run (and await) the callback;
+                # the menu itself is being removed.
+                self.app.call_later(item.callback)
             else:
                 item.callback()
 
     def _dismiss(self) -> None:
-        """Post the Closed message and remove from the DOM."""
+        """Post the Closed message and remove from the DOM (once)."""
+        if self._dismissed:
+            return
+        self._dismissed = True
         self.post_message(self.Closed())
         self.remove()
@@ -9,6 +9,7 @@ and communicate selections via Textual messages.
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 from dataclasses import dataclass, field
@@ -21,16 +22,32 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Static
 
+# Section updates arriving within this window (seconds) share one rebuild.
+_REBUILD_DELAY = 0.05
+
+_SEPARATOR_TEXT = "\u2500" * 30
+
+# Cached ``_log.isEnabledFor(logging.DEBUG)`` so click/hover/open paths skip
+# building log records when debug output is off.  Refreshed whenever a
+# MenuBar mounts or rebuilds, which picks up level changes made at startup.
+_debug_enabled = _log.isEnabledFor(logging.DEBUG)
+
+
+def _refresh_debug_enabled() -> None:
+    global _debug_enabled
+    _debug_enabled = _log.isEnabledFor(logging.DEBUG)
+
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuAction:
     """A single menu item within a dropdown section.
 
@@ -43,9 +60,38 @@ class MenuAction:
     hotkey_hint: str = ""
     disabled: bool = False
     separator: bool = False
+    # Lazily filled caches for the dropdown row (slots rule out cached_property).
+    _rendered_text: str | None = field(default=None, init=False, repr=False, compare=False)
+    _rendered_classes: str | None = field(default=None, init=False, repr=False, compare=False)
 
+    @property
+    def rendered_text(self) -> str:
+        """Markup shown for this item in a dropdown."""
+        text = self._rendered_text
+        if text is None:
+            if self.separator:
+                text = _SEPARATOR_TEXT
+            elif self.hotkey_hint:
+                text = f"{self.label}  [{self.hotkey_hint}]"
+            else:
+                text = self.label
+            self._rendered_text = text
+        return text
 
-@dataclass
+    @property
+    def rendered_classes(self) -> str:
+        """CSS classes for this item's dropdown row."""
+        classes = self._rendered_classes
+        if classes is None:
+            if self.separator:
+                classes = "--separator"
+            else:
+                classes = "--disabled" if self.disabled else ""
+            self._rendered_classes = classes
+        return classes
+
+
+@dataclass(slots=True)
 class MenuSection:
     """A named group of menu actions displayed as a dropdown."""
 
@@ -100,15 +146,7 @@ class _MenuItemWidget(Static):
         self.action = action
         self.section_name = section_name
         self.item_index = index
-
-        if action.separator:
-            markup_text = "\u2500" * 30
-            super().__init__(markup_text, classes="--separator", **kwargs)
-        else:
-            hint_part = f"  [{action.hotkey_hint}]" if action.hotkey_hint else ""
-            markup_text = f"{action.label}{hint_part}"
-            classes = "--disabled" if action.disabled else ""
-            super().__init__(markup_text, classes=classes, **kwargs)
+        super().__init__(action.rendered_text, classes=action.rendered_classes, **kwargs)
 
     @property
     def is_selectable(self) -> bool:
@@ -117,10 +155,7 @@ class _MenuItemWidget(Static):
 
     def highlight(self, on: bool) -> None:
         """Toggle visual highlight state."""
-        if on:
-            self.add_class("--highlighted")
-        else:
-            self.remove_class("--highlighted")
+        self.set_class(on, "--highlighted")
 
     async def on_click(self, event: events.Click) -> None:
         """Handle click on this menu item."""
@@ -183,7 +218,11 @@ class MenuDropdown(Widget):
         super().__init__(**kwargs)
         self.section = section
         self.menu_bar: MenuBar | None = menu_bar
+        self._mounted = False
         self._item_widgets: list[_MenuItemWidget] = []
+        # Selectable item indices, and index -> position within that list.
+        self._selectable: tuple[int, ...] = ()
+        self._selectable_pos: dict[int, int] = {}
 
     def compose(self) -> ComposeResult:
         self._item_widgets = []
@@ -195,14 +234,19 @@ class MenuDropdown(Widget):
             )
             self._item_widgets.append(widget)
             yield widget
+        self._selectable = tuple(i for i, w in enumerate(self._item_widgets) if w.is_selectable)
+        self._selectable_pos = {idx: pos for pos, idx in enumerate(self._selectable)}
+
+    def on_mount(self) -> None:
+        self._mounted = True
+
+    def on_unmount(self) -> None:
+        self._mounted = False
 
     @property
     def is_visible(self) -> bool:
         """Whether the dropdown is currently mounted/displayed."""
-        try:
-            return self.parent is not None
-        except Exception:
-            return False
+        return self._mounted and self.display
 
     def watch_highlighted_index(self, old: int, new: int) -> None:
         """Update visual highlight when the index changes."""
@@ -211,33 +255,29 @@ class MenuDropdown(Widget):
         if 0 <= new < len(self._item_widgets):
             self._item_widgets[new].highlight(True)
 
-    def _selectable_indices(self) -> list[int]:
+    def _selectable_indices(self) -> tuple[int, ...]:
         """Return indices of items that can be highlighted."""
-        return [
-            i
-            for i, w in enumerate(self._item_widgets)
-            if w.is_selectable
-        ]
+        return self._selectable
 
     def _move_highlight(self, direction: int) -> None:
         """Move the highlight up (-1) or down (+1)."""
-        selectable = self._selectable_indices()
+        selectable = self._selectable
         if not selectable:
             return
         if self.highlighted_index < 0:
             self.highlighted_index = selectable[0] if direction > 0 else selectable[-1]
             return
-        try:
-            current_pos = selectable.index(self.highlighted_index)
-        except ValueError:
-            current_pos = -1 if direction > 0 else len(selectable)
+        current_pos = self._selectable_pos.get(
+            self.highlighted_index, -1 if direction > 0 else len(selectable)
+        )
         next_pos = current_pos + direction
         if 0 <= next_pos < len(selectable):
             self.highlighted_index = selectable[next_pos]
 
     def _select_action(self, action: MenuAction) -> None:
         """Handle selection of an action — notify the menu bar directly."""
-        _log.info("Dropdown item selected: %s", action.label)
+        if _debug_enabled:
+            _log.debug("Dropdown item selected: %s", action.label)
         if self.menu_bar:
             self.menu_bar._handle_item_selected(self.section.name, action)
 
@@ -292,9 +332,11 @@ class MenuDropdown(Widget):
         except Exception:
             focused = None
         # If focus moved to another part of the menu bar, let it handle things.
-        if focused is not None and bar is not None:
-            if focused is bar or focused in bar.query("*"):
+        node = focused
+        while node is not None:
+            if node is bar:
                 return
+            node = node.parent
         bar._close_dropdown()
 
 
@@ -321,32 +363,13 @@ class _MenuSectionLabel(Static):
     }
     """
 
+    # Clicks and hovers are handled by MenuBar, which receives them as they
+    # bubble up from the labels.
+
     def __init__(self, section_name: str, **kwargs) -> None:
         super().__init__(f" {section_name} ", **kwargs)
         self.section_name = section_name
 
-    async def on_click(self, event: events.Click) -> None:
-        """Toggle the dropdown for this section."""
-        event.stop()
-        _log.debug("SectionLabel clicked: %s, parent=%s", self.section_name, type(self.parent).__name__)
-        bar = self.parent
-        if isinstance(bar, Horizontal):
-            bar = bar.parent
-        _log.debug("Resolved bar type: %s", type(bar).__name__)
-        if isinstance(bar, MenuBar):
-            bar._toggle_section(self.section_name)
-        else:
-            _log.warning("Could not find MenuBar from label parent chain")
-
-    async def on_enter(self, event: events.Enter) -> None:
-        """Switch dropdown when hovering while another is open."""
-        bar = self.parent
-        if isinstance(bar, Horizontal):
-            bar = bar.parent
-        if isinstance(bar, MenuBar) and bar._active_section is not None:
-            if bar._active_section != self.section_name:
-                bar._open_section(self.section_name)
-
 
 # ---------------------------------------------------------------------------
 # Main MenuBar widget
@@ -407,10 +430,25 @@ class MenuBar(Widget):
         self._static_sections: list[MenuSection] = static_sections or self._default_static_sections()
         self._dynamic_sections: list[MenuSection] = dynamic_sections or []
         self._active_section: str | None = None
+        self._active_label: _MenuSectionLabel | None = None
         self._dropdowns: dict[str, MenuDropdown] = {}
         self._labels: dict[str, _MenuSectionLabel] = {}
         self._label_container: Horizontal | None = None
         self._rebuild_counter: int = 0
+        # Section updates waiting for the deferred rebuild.
+        self._pending_static_sections: list[MenuSection] | None = None
+        self._pending_dynamic_sections: list[MenuSection] | None = None
+        self._rebuild_timer: Timer | None = None
+        # Strong references to running async action callbacks.
+        self._callback_tasks: set[asyncio.Task] = set()
+        # Derived from static + dynamic sections; reset whenever either changes.
+        self._all_sections_cache: list[MenuSection] | None = None
+        self._section_names_cache: tuple[str, ...] | None = None
+        self._section_index: dict[str, MenuSection] | None = None
+        # Section name -> x offset of its label, refreshed after layout changes.
+        self._label_offsets: dict[str, int] = {}
+        # Screen row just below the bar, where dropdowns open; refreshed on resize.
+        self._dropdown_y: int = 2  # fallback: below header + menu bar
 
     # -- Default sections ---------------------------------------------------
 
@@ -443,35 +481,92 @@ class MenuBar(Widget):
     @property
     def all_sections(self) -> list[MenuSection]:
         """Combined list of static + dynamic sections in display order."""
-        return self._static_sections + self._dynamic_sections
+        if self._all_sections_cache is None:
+            self._all_sections_cache = self._static_sections + self._dynamic_sections
+        return self._all_sections_cache
 
     @property
-    def section_names(self) -> list[str]:
+    def section_names(self) -> tuple[str, ...]:
         """Names of all current sections."""
-        return [s.name for s in self.all_sections]
+        if self._section_names_cache is None:
+            self._section_names_cache = tuple(s.name for s in self.all_sections)
+        return self._section_names_cache
+
+    def _invalidate_sections(self) -> None:
+        """Drop the cached section views after the section lists change."""
+        self._all_sections_cache = None
+        self._section_names_cache = None
+        self._section_index = None
 
     # -- Public API ---------------------------------------------------------
 
     def set_static_sections(self, sections: list[MenuSection]) -> None:
-        """Replace the static menu sections and rebuild the bar."""
-        self._static_sections = sections
-        self._rebuild()
+        """Replace the static menu sections and rebuild the bar.
+
+        The rebuild is deferred briefly so that several updates in quick
+        succession are applied together. Sections equal to the current
+        ones are ignored.
+        """
+        current = self._pending_static_sections
+        if current is None:
+            current = self._static_sections
+        if sections == current:
+            return
+        self._pending_static_sections = sections
+        self._schedule_rebuild()
 
     def set_dynamic_sections(self, sections: list[MenuSection]) -> None:
         """Replace the dynamic menu sections and rebuild the bar.
 
         Call this when the focused window or context changes to update
-        the available menu items.
+        the available menu items. Like :meth:`set_static_sections`, the
+        rebuild is deferred so rapid context switches only rebuild once,
+        and skipped entirely when the sections are unchanged.
         """
-        self._dynamic_sections = sections
+        current = self._pending_dynamic_sections
+        if current is None:
+            current = self._dynamic_sections
+        if sections == current:
+            return
+        self._pending_dynamic_sections = sections
+        self._schedule_rebuild()
+
+    def _schedule_rebuild(self) -> None:
+        """Start the rebuild timer unless one is already pending."""
+        if self._rebuild_timer is None:
+            self._rebuild_timer = self.set_timer(_REBUILD_DELAY, self._flush_rebuild)
+
+    def _flush_rebuild(self) -> None:
+        """Apply pending section updates and rebuild once."""
+        self._rebuild_timer = None
+        changed = False
+        pending = self._pending_static_sections
+        if pending is not None:
+            self._pending_static_sections = None
+            if pending != self._static_sections:
+                self._static_sections = pending
+                changed = True
+        pending = self._pending_dynamic_sections
+        if pending is not None:
+            self._pending_dynamic_sections = None
+            if pending != self._dynamic_sections:
+                self._dynamic_sections = pending
+                changed = True
+        if not changed:
+            # Updates cancelled each other out (e.g. A -> B -> A).
+            return
+        self._invalidate_sections()
         self._rebuild()
 
     def get_section(self, name: str) -> MenuSection | None:
         """Look up a section by name, or return ``None``."""
-        for section in self.all_sections:
-            if section.name == name:
-                return section
-        return None
+        if self._section_index is None:
+            index: dict[str, MenuSection] = {}
+            for section in self.all_sections:
+                # First section wins on duplicate names.
+                index.setdefault(section.name, section)
+            self._section_index = index
+        return self._section_index.get(name)
 
     # -- Compose & Rebuild --------------------------------------------------
 
@@ -480,6 +575,9 @@ class MenuBar(Widget):
         slug = section_name.lower().replace(" ", "-")
         return f"menu-dd-{slug}-{self._rebuild_counter}"
 
+    def on_mount(self) -> None:
+        _refresh_debug_enabled()
+
     def compose(self) -> ComposeResult:
         self._label_container = Horizontal()
         with self._label_container:
@@ -492,55 +590,74 @@ class MenuBar(Widget):
 
     def _rebuild(self) -> None:
         """Tear down and rebuild all child widgets after sections change."""
+        _refresh_debug_enabled()
         self._close_dropdown()
+        self._invalidate_sections()
 
         # Bump counter so new widgets get fresh IDs
         self._rebuild_counter += 1
 
         # Remove any screen-mounted dropdowns from previous build
-        for dropdown in self._dropdowns.values():
-            dropdown.remove()
-        self._dropdowns.clear()
+        if self._dropdowns:
+            self.screen.remove_children(list(self._dropdowns.values()))
+            self._dropdowns.clear()
 
         # Collect old label widgets to remove
         old_widgets = list(self._nodes)
         self._labels.clear()
 
-        # Build new label container
-        self._label_container = Horizontal()
+        # Build the new label container with its children up front so it is
+        # mounted (and laid out) in one step.
         new_labels: list[_MenuSectionLabel] = []
         for section in self.all_sections:
             label = _MenuSectionLabel(section.name)
             self._labels[section.name] = label
             new_labels.append(label)
+        self._label_container = Horizontal(*new_labels)
 
         # Mount new container, then remove old ones
         self.mount(self._label_container)
-        for label in new_labels:
-            self._label_container.mount(label)
+        self.remove_children(old_widgets)
 
-        for widget in old_widgets:
-            widget.remove()
+        # Label positions are only known once the new labels are laid out.
+        self._label_offsets = {}
+        self.call_after_refresh(self._update_label_offsets)
 
     # -- Dropdown management ------------------------------------------------
 
-    def _calculate_offset(self, section_name: str) -> int:
-        """Calculate the horizontal offset for a dropdown."""
+    def _update_label_offsets(self) -> None:
+        """Recompute the x offset of every section label (prefix sum of widths)."""
+        offsets: dict[str, int] = {}
         offset = 0
         for name in self.section_names:
-            if name == section_name:
-                break
+            offsets[name] = offset
             label = self._labels.get(name)
             if label is not None:
                 try:
                     offset += label.region.width
                 except Exception:
                     offset += len(name) + 4  # fallback: name + padding
+        self._label_offsets = offsets
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Label positions and the dropdown row may shift when the bar is resized."""
+        region = self.region
+        if region:
+            self._dropdown_y = region.y + region.height
+        self._update_label_offsets()
+
+    def _calculate_offset(self, section_name: str) -> int:
+        """Return the horizontal offset for a dropdown."""
+        offset = self._label_offsets.get(section_name)
+        if offset is None:
+            self._update_label_offsets()
+            offset = self._label_offsets.get(section_name, 0)
         return offset
 
     def _toggle_section(self, section_name: str) -> None:
         """Toggle a section's dropdown open or closed."""
-        _log.info("_toggle_section(%s), active=%s", section_name, self._active_section)
+        if _debug_enabled:
+            _log.debug("_toggle_section(%s), active=%s", section_name, self._active_section)
         if self._active_section == section_name:
             self._close_dropdown()
         else:
@@ -548,7 +665,8 @@ class MenuBar(Widget):
 
     def _open_section(self, section_name: str) -> None:
         """Open the dropdown for the named section, closing any other."""
-        _log.info("_open_section(%s)", section_name)
+        if _debug_enabled:
+            _log.debug("_open_section(%s)", section_name)
         if self._active_section is not None:
             self._close_dropdown(clear_active=False)
 
@@ -559,31 +677,43 @@ class MenuBar(Widget):
             return
 
         self._active_section = section_name
-        for name, label in self._labels.items():
-            if name == section_name:
-                label.add_class("--active")
-            else:
-                label.remove_class("--active")
-
-        # Create and mount dropdown on the screen (not inside MenuBar)
-        # so it isn't clipped by MenuBar's height: 1.
+        # Any previously active label was reset by _close_dropdown above.
+        label = self._labels.get(section_name)
+        if label is not None:
+            label.set_class(True, "--active")
+        self._active_label = label
+
+        # Dropdowns are built once per rebuild and reused on later opens.
+        # They are mounted on the screen (not inside MenuBar) so they
+        # aren't clipped by MenuBar's height: 1.
         dropdown = self._dropdowns.get(section_name)
-        if dropdown is not None:
-            dropdown.remove()
-        dd_id = self._dropdown_id(section_name)
-        dropdown = MenuDropdown(section, menu_bar=self, id=dd_id)
-        self._dropdowns[section_name] = dropdown
-
-        # Calculate position: x from label offset, y from MenuBar's bottom edge
+        if dropdown is None:
+            dd_id = self._dropdown_id(section_name)
+            dropdown = MenuDropdown(section, menu_bar=self, id=dd_id)
+            self._dropdowns[section_name] = dropdown
+
+        # Calculate position: x from label offset, y from MenuBar's bottom edge.
+        # The offset is applied before showing/mounting so the first layout
+        # already uses it.
         offset_x = self._calculate_offset(section_name)
-        try:
-            bar_y = self.region.y + self.region.height
-        except Exception:
-            bar_y = 2  # fallback: below header + menu bar
-        _log.info("Mounting dropdown %s at (%d, %d)", dd_id, offset_x, bar_y)
-        self.screen.mount(dropdown)
+        bar_y = self._dropdown_y
         dropdown.styles.offset = (offset_x, bar_y)
-        dropdown.add_class("--visible")
+        if dropdown.is_attached:
+            if _debug_enabled:
+                _log.debug("Showing dropdown %s at (%d, %d)", dropdown.id, offset_x, bar_y)
+            dropdown.highlighted_index = -1
+            dropdown.display = True
+        else:
+            if _debug_enabled:
+                _log.debug("Mounting dropdown %s at (%d, %d)", dropdown.id, offset_x, bar_y)
+            self.screen.mount(dropdown)
+        self.call_after_refresh(self._activate_dropdown, dropdown)
+
+    def _activate_dropdown(self, dropdown: MenuDropdown) -> None:
+        """Mark a just-opened dropdown visible and focus it (one redraw)."""
+        if self._dropdowns.get(self._active_section or "") is not dropdown:
+            return  # closed or switched before the refresh
+        dropdown.set_class(True, "--visible")
         dropdown.focus()
 
     def _close_dropdown(self, clear_active: bool = True) -> None:
@@ -591,12 +721,14 @@ class MenuBar(Widget):
         if self._active_section is not None:
             dropdown = self._dropdowns.get(self._active_section)
             if dropdown is not None:
-                _log.debug("Closing dropdown for %s", self._active_section)
-                dropdown.remove()
-                del self._dropdowns[self._active_section]
-            label = self._labels.get(self._active_section)
-            if label is not None:
-                label.remove_class("--active")
+                # Hide rather than remove so the next open reuses the widgets.
+                if _debug_enabled:
+                    _log.debug("Closing dropdown for %s", self._active_section)
+                dropdown.display = False
+                dropdown.set_class(False, "--visible")
+        if self._active_label is not None:
+            self._active_label.set_class(False, "--active")
+            self._active_label = None
         if clear_active:
             self._active_section = None
 
@@ -616,7 +748,8 @@ class MenuBar(Widget):
 
     def _handle_item_selected(self, section_name: str, action: MenuAction) -> None:
         """Called by MenuDropdown when an item is selected."""
-        _log.info("MenuBar._handle_item_selected: section=%s label=%s", section_name, action.label)
+        if _debug_enabled:
+            _log.debug("MenuBar._handle_item_selected: section=%s label=%s", section_name, action.label)
         self._close_dropdown()
 
         # Post the public message for the parent app
@@ -628,25 +761,42 @@ class MenuBar(Widget):
             )
         )
 
-        # Invoke the callback deferred so the DOM has settled after
-        # the dropdown close (which triggers focus changes / reorders).
-        if action.callback is not None:
-            self.call_later(self._run_action_callback, action.callback)
-
-    @staticmethod
-    def _run_action_callback(callback: Callable) -> None:
-        """Execute a menu action callback, handling async if needed."""
-        result = callback()
-        if inspect.isawaitable(result):
-            import asyncio
-            asyncio.ensure_future(result)
+        callback = action.callback
+        if callback is None:
+            return
+        if inspect.iscoroutinefunction(callback):
+            # Async callbacks go straight onto the loop as a task.
+            task = asyncio.create_task(callback())
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+        else:
+            # Invoke sync callbacks deferred so the DOM has settled after
+            # the dropdown close (which triggers focus changes / reorders).
+            # Textual awaits any awaitable the callback returns.
+            self.call_later(callback)
 
-    # -- Global click handling (close on click-outside) ---------------------
+    # -- Mouse handling (label clicks/hover, close on click-outside) --------
 
     def on_click(self, event: events.Click) -> None:
-        """Close dropdown if clicking on the bar background (not a label)."""
+        """Toggle a section when its label is clicked, else close the dropdown."""
+        target = event.widget
+        if isinstance(target, _MenuSectionLabel):
+            event.stop()
+            if _debug_enabled:
+                _log.debug("SectionLabel clicked: %s", target.section_name)
+            self._toggle_section(target.section_name)
+            return
+        # Click on the bar background.
         self._close_dropdown()
 
+    def on_enter(self, event: events.Enter) -> None:
+        """Switch dropdown when hovering a label while another is open."""
+        target = event.node
+        if not isinstance(target, _MenuSectionLabel):
+            return
+        if self._active_section is not None and self._active_section != target.section_name:
+            self._open_section(target.section_name)
+
     # -- Escape from bar itself ---------------------------------------------
 
     async def on_key(self, event: events.Key) -> None:
@@ -7,6 +7,8 @@ grip, and full window management (minimize, maximize, close, drag, resize).
 
 Usage:
     class MyApp(App):
+        CSS = WINDOW_SYSTEM_CSS  # from workbench.tui.window_manager
+
         def compose(self) -> ComposeResult:
             with Window(title="Editor", id="editor-win"):
                 yield TextArea()
@@ -21,6 +23,7 @@ Messages posted:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from enum import Enum
@@ -36,6 +39,12 @@ from textual.message import Message
 from textual.reactive import reactive
 from textual.widgets import Static
 
+# Maximum gap between title-bar clicks that counts as a double-click (0.4 s)
+_DOUBLE_CLICK_NS = 400_000_000
+
+# CSS classes mirroring WindowState
+_STATE_CLASSES = ("-normal", "-minimized", "-maximized")
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -60,82 +69,47 @@ class _TitleBar(Container):
     the right.  Mouse events on the title bar drive window dragging.
     """
 
-    DEFAULT_CSS = """
-    _TitleBar {
-        layout: horizontal;
-        width: 1fr;
-        height: 1;
-        background: #e67e00;
-        color: #e8e8e8;
-    }
-    _TitleBar > .window-title-label {
-        width: 1fr;
-        height: 1;
-        padding: 0 1;
-        text-style: bold;
-        color: #ffffff;
-    }
-    _TitleBar > .window-btn {
-        width: 4;
-        height: 1;
-        min-width: 4;
-        text-align: center;
-        background: #e67e00;
-        color: #e8e8e8;
-    }
-    _TitleBar > .window-btn:hover {
-        background: #ff8c00;
-        color: #ffffff;
-    }
-    _TitleBar > .window-btn-close:hover {
-        background: #ef4444;
-        color: #ffffff;
-    }
-    """
+    __slots__ = ("_label", "_maximize_btn", "_title_text")
+
+    _wb_role = "titlebar"
 
     def __init__(self, title: str) -> None:
         super().__init__()
         self._title_text = title
+        self._label: Static | None = None
+        self._maximize_btn: Static | None = None
 
     def compose(self) -> ComposeResult:
-        yield Static(self._title_text, classes="window-title-label")
-        yield Static("[_]", classes="window-btn window-btn-minimize")
-        yield Static("[\u25a1]", classes="window-btn window-btn-maximize")
-        yield Static("[X]", classes="window-btn window-btn-close")
+        self._label = Static(self._title_text, classes="window-title-label")
+        self._label._wb_role = "titlebar"
+        minimize_btn = Static("[_]", classes="window-btn window-btn-minimize")
+        self._maximize_btn = Static("[\u25a1]", classes="window-btn window-btn-maximize")
+        close_btn = Static("[X]", classes="window-btn window-btn-close")
+        for btn in (minimize_btn, self._maximize_btn, close_btn):
+            btn._wb_role = "titlebar-btn"
+        yield self._label
+        yield minimize_btn
+        yield self._maximize_btn
+        yield close_btn
 
     def set_title(self, title: str) -> None:
         """Update the title text displayed in the bar."""
         self._title_text = title
-        try:
-            label = self.query_one(".window-title-label", Static)
-            label.update(title)
-        except Exception:
-            pass
+        if self._label is not None:
+            self._label.update(title)
 
     def set_maximize_icon(self, maximized: bool) -> None:
         """Toggle the maximize button icon between maximize/restore."""
-        try:
-            btn = self.query_one(".window-btn-maximize", Static)
-            btn.update("[\u229e]" if maximized else "[\u25a1]")
-        except Exception:
-            pass
+        if self._maximize_btn is not None:
+            self._maximize_btn.update("[\u229e]" if maximized else "[\u25a1]")
 
 
 class _ResizeGrip(Static):
     """Small grip in the bottom-right corner that enables window resizing."""
 
-    DEFAULT_CSS = """
-    _ResizeGrip {
-        dock: bottom;
-        width: 2;
-        height: 1;
-        content-align: right bottom;
-        color: #a0a0a0;
-    }
-    _ResizeGrip:hover {
-        color: #ff8c00;
-    }
-    """
+    __slots__ = ()
+
+    _wb_role = "resize-grip"
 
     def __init__(self) -> None:
         super().__init__("\u22f1")  # down-right diagonal ellipsis
@@ -144,12 +118,7 @@ class _ResizeGrip(Static):
 class _ContentArea(ScrollableContainer):
     """Scrollable container for window content."""
 
-    DEFAULT_CSS = """
-    _ContentArea {
-        width: 1fr;
-        height: 1fr;
-    }
-    """
+    __slots__ = ()
 
 
 # ---------------------------------------------------------------------------
@@ -167,46 +136,51 @@ class Window(Container):
         min_height: Minimum allowed height in rows.
         *children: Child widgets placed inside the content area.
         **kwargs: Passed through to ``Container.__init__``.
-    """
 
-    # -- Textual CSS -----------------------------------------------------------
-
-    DEFAULT_CSS = """
-    Window {
-        position: absolute;
-        width: 60;
-        height: 20;
-        border: solid #333333;
-        background: #1a1a1a;
-        overflow: hidden;
-        layer: windows;
-    }
-    Window:focus-within {
-        border: thick #ff8c00;
-    }
-    Window.-maximized {
-        border: thick #ff8c00;
-    }
-    Window.-minimized {
-        display: none;
-    }
-    Window > ._grip-row {
-        dock: bottom;
-        height: 1;
-        width: 1fr;
-        layout: horizontal;
-    }
-    Window > ._grip-row > ._grip-spacer {
-        width: 1fr;
-        height: 1;
-    }
+    Styling for the window and its chrome lives in
+    ``workbench.tui.window_manager.WINDOW_SYSTEM_CSS``, which the app
+    must include in its CSS.
     """
 
+    __slots__ = (
+        "_child_widgets",
+        "_content_area",
+        "_drag_armed",
+        "_drag_last_offset",
+        "_drag_mouse_start",
+        "_drag_offset_start",
+        "_geom_dirty",
+        "_gx",
+        "_gy",
+        "_last_applied_offset",
+        "_last_applied_size",
+        "_last_titlebar_click_ns",
+        "_latest_move",
+        "_min_height",
+        "_min_width",
+        "_pending_offset",
+        "_pending_size",
+        "_resize_armed",
+        "_resize_grip",
+        "_resize_mouse_start",
+        "_resize_size_start",
+        "_saved_height",
+        "_saved_offset",
+        "_saved_width",
+        "_title_bar",
+    )
+
+    # Cells the mouse must travel (|dx| + |dy|) after mouse-down before a
+    # drag or resize actually starts; smaller jitter is ignored.
+    DRAG_THRESHOLD: int = 2
+
     # -- Messages --------------------------------------------------------------
 
     class Focused(Message):
         """Posted when the window is focused (clicked anywhere)."""
 
+        __slots__ = ("window",)
+
         def __init__(self, window: Window) -> None:
             super().__init__()
             self.window: Window = window
@@ -214,6 +188,8 @@ class Window(Container):
     class Closed(Message):
         """Posted when the close button is clicked."""
 
+        __slots__ = ("window",)
+
         def __init__(self, window: Window) -> None:
             super().__init__()
             self.window: Window = window
@@ -221,10 +197,13 @@ class Window(Container):
     class StateChanged(Message):
         """Posted when the window state changes (minimize/maximize/restore)."""
 
-        def __init__(self, window: Window, state: str) -> None:
+        __slots__ = ("old_state", "state", "window")
+
+        def __init__(self, window: Window, state: str, old_state: str = "") -> None:
             super().__init__()
             self.window: Window = window
             self.state: str = state
+            self.old_state: str = old_state
 
     # -- Reactive state --------------------------------------------------------
 
@@ -251,22 +230,42 @@ class Window(Container):
             classes=classes,
             disabled=disabled,
         )
+        # Child widgets, created in compose()
+        self._title_bar: _TitleBar | None = None
+        self._content_area: _ContentArea | None = None
+        self._resize_grip: _ResizeGrip | None = None
+
         self.window_title = title
         self._child_widgets = children
-        self._grid_size = grid_size
+        self._gx, self._gy = grid_size
         self._min_width = min_width
         self._min_height = min_height
 
         # Drag state
         self._drag_mouse_start: Offset | None = None
         self._drag_offset_start: Offset | None = None
+        self._drag_armed: bool = False
+        # Last offset produced by the current drag gesture
+        self._drag_last_offset: tuple[int, int] | None = None
 
         # Resize state
         self._resize_mouse_start: Offset | None = None
         self._resize_size_start: tuple[int, int] | None = None
+        self._resize_armed: bool = False
+
+        # Mouse moves only record the latest pointer position and set
+        # _geom_dirty; the _geom_loop worker turns it into geometry.  Earlier
+        # samples are simply overwritten, so a backlog of moves costs nothing.
+        self._latest_move: Offset | None = None
+        self._pending_offset: tuple[int, int] | None = None
+        self._pending_size: tuple[int, int] | None = None
+        self._geom_dirty = asyncio.Event()
+        # Geometry last written to the styles, so unchanged writes can be skipped
+        self._last_applied_offset: tuple[int, int] | None = None
+        self._last_applied_size: tuple[int, int] | None = None
 
         # Double-click detection on title bar
-        self._last_titlebar_click: float = 0.0
+        self._last_titlebar_click_ns: int = 0
 
         # Saved geometry for restore from maximized
         self._saved_offset: Offset | None = None
@@ -276,17 +275,28 @@ class Window(Container):
     # -- Compose ---------------------------------------------------------------
 
     def compose(self) -> ComposeResult:
-        yield _TitleBar(self.window_title)
-        with _ContentArea():
+        self._title_bar = _TitleBar(self.window_title)
+        self._content_area = _ContentArea()
+        self._resize_grip = _ResizeGrip()
+        yield self._title_bar
+        with self._content_area:
             yield from self._child_widgets
         with Container(classes="_grip-row"):
             yield Static("", classes="_grip-spacer")
-            yield _ResizeGrip()
+            yield self._resize_grip
+
+    def on_mount(self) -> None:
+        # watch_window_state skips the initial no-op call, so apply the
+        # starting state class here.
+        self.add_class(f"-{self.window_state.value}")
+        self.run_worker(self._geom_loop(), name="geometry", group="geometry", exclusive=True)
 
     # -- Reactive watchers -----------------------------------------------------
 
     def watch_window_state(self, old: WindowState, new: WindowState) -> None:
         """React to state changes by updating CSS classes and geometry."""
+        if old == new:
+            return
         _log.info("Window %s state: %s -> %s", self.id, old.value, new.value)
 
         # Save geometry BEFORE class changes so we read the real dimensions,
@@ -294,38 +304,34 @@ class Window(Container):
         if old == WindowState.NORMAL and new != WindowState.NORMAL:
             self._save_geometry()
 
-        # Remove old state classes
-        self.remove_class("-normal", "-minimized", "-maximized")
-        # Add new
-        self.add_class(f"-{new.value}")
+        new_class = f"-{new.value}"
+        self.remove_class(*(cls for cls in _STATE_CLASSES if cls != new_class))
+        self.add_class(new_class)
 
         if new == WindowState.MAXIMIZED:
             # Set dimensions programmatically — CSS `1fr` doesn't resolve
             # correctly for `position: absolute` elements in Textual.
             parent = self.parent
             if parent is not None:
-                self.styles.offset = (0, 0)
-                self.styles.width = parent.size.width
-                self.styles.height = parent.size.height
-            title_bar = self.query_one(_TitleBar)
-            title_bar.set_maximize_icon(True)
+                self._write_offset((0, 0))
+                self._write_size((parent.size.width, parent.size.height))
+            if self._title_bar is not None:
+                self._title_bar.set_maximize_icon(True)
 
         elif new == WindowState.NORMAL:
             self._restore_geometry()
-            title_bar = self.query_one(_TitleBar)
-            title_bar.set_maximize_icon(False)
+            if self._title_bar is not None:
+                self._title_bar.set_maximize_icon(False)
 
         elif new == WindowState.MINIMIZED:
             pass  # display: none via CSS class
 
-        self.post_message(self.StateChanged(self, new.value))
+        self.post_message(self.StateChanged(self, new.value, old.value))
 
     def watch_window_title(self, old: str, new: str) -> None:
         """Update the title bar label when the reactive title changes."""
-        try:
-            self.query_one(_TitleBar).set_title(new)
-        except Exception:
-            pass
+        if self._title_bar is not None:
+            self._title_bar.set_title(new)
 
     # -- Geometry helpers ------------------------------------------------------
 
@@ -362,21 +368,90 @@ class Window(Container):
     def _restore_geometry(self) -> None:
         """Restore previously saved geometry (offset and size)."""
         if self._saved_offset is not None:
-            self.styles.offset = (self._saved_offset.x, self._saved_offset.y)
-        if self._saved_width is not None:
-            self.styles.width = self._saved_width
-        if self._saved_height is not None:
-            self.styles.height = self._saved_height
+            self._write_offset((self._saved_offset.x, self._saved_offset.y))
+        if self._saved_width is not None and self._saved_height is not None:
+            self._write_size((self._saved_width, self._saved_height))
+
+    async def _geom_loop(self) -> None:
+        """Apply pending drag/resize geometry each time it is marked dirty."""
+        while True:
+            await self._geom_dirty.wait()
+            self._geom_dirty.clear()
+            self._flush_geometry()
+
+    def _consume_latest_move(self) -> None:
+        """Turn the latest recorded mouse position into pending geometry."""
+        pos = self._latest_move
+        if pos is None:
+            return
+        self._latest_move = None
+
+        if self._resize_mouse_start is not None and self._resize_size_start is not None:
+            dx = pos.x - self._resize_mouse_start.x
+            dy = pos.y - self._resize_mouse_start.y
+            if not self._resize_armed:
+                if abs(dx) + abs(dy) < self.DRAG_THRESHOLD:
+                    return
+                self._resize_armed = True
+            size = (
+                max(self._resize_size_start[0] + dx, self._min_width),
+                max(self._resize_size_start[1] + dy, self._min_height),
+            )
+            # Moves inside the same cell, or pinned at the minimum size,
+            # leave nothing to apply.
+            self._pending_size = None if size == self._last_applied_size else size
+
+        elif self._drag_mouse_start is not None and self._drag_offset_start is not None:
+            dx = pos.x - self._drag_mouse_start.x
+            dy = pos.y - self._drag_mouse_start.y
+            if not self._drag_armed:
+                if abs(dx) + abs(dy) < self.DRAG_THRESHOLD:
+                    return
+                self._drag_armed = True
+            offset = (self._drag_offset_start.x + dx, self._drag_offset_start.y + dy)
+            self._drag_last_offset = self._pending_offset = offset
+
+    def _flush_geometry(self) -> None:
+        """Write the most recent pending size/offset to the styles."""
+        self._consume_latest_move()
+        if self._pending_size is not None:
+            self._write_size(self._pending_size)
+            self._pending_size = None
+        if self._pending_offset is not None:
+            self._write_offset(self._pending_offset)
+            self._pending_offset = None
+
+    def _write_offset(self, offset: tuple[int, int]) -> None:
+        """Set styles.offset unless it already holds this value."""
+        if offset != self._last_applied_offset:
+            self._last_applied_offset = offset
+            self.styles.offset = offset
+
+    def _write_size(self, size: tuple[int, int]) -> None:
+        """Set styles width/height unless they already hold these values."""
+        if size != self._last_applied_size:
+            self._last_applied_size = size
+            self.styles.width, self.styles.height = size
 
     def _snap_to_grid(self, x: int, y: int) -> tuple[int, int]:
         """Snap coordinates to the configured grid."""
-        gx, gy = self._grid_size
-        return (round(x / gx) * gx, round(y / gy) * gy)
+        gx = self._gx
+        gy = self._gy
+        if gx == 1 and gy == 1:
+            return (x, y)
+        # Integer round-half-up to the nearest grid line
+        return (((x + gx // 2) // gx) * gx, ((y + gy // 2) // gy) * gy)
 
     # -- Focus / z-order -------------------------------------------------------
 
     def on_click(self, event: events.Click) -> None:
         """Post Focused message when clicked anywhere in the window."""
+        widget = event.widget
+        if widget is not None and (
+            widget.has_class("window-btn-minimize") or widget.has_class("window-btn-close")
+        ):
+            # The window is about to be hidden or removed; raising it is wasted work
+            return
         _log.debug("Window %s clicked, posting Focused", self.id)
         self.post_message(self.Focused(self))
 
@@ -401,23 +476,12 @@ class Window(Container):
 
     def _is_titlebar_target(self, event: events.MouseEvent) -> bool:
         """Return True if the event originated from the title bar (not a button)."""
-        widget = event.widget if hasattr(event, "widget") else None
-        if widget is None:
-            return False
-        # Accept the title bar itself or its title label child
-        if isinstance(widget, _TitleBar):
-            return True
-        if hasattr(widget, "parent") and isinstance(widget.parent, _TitleBar):
-            # But not the control buttons
-            if widget.has_class("window-btn"):
-                return False
-            return True
-        return False
+        # The title bar and its label are tagged "titlebar"; buttons are not.
+        return getattr(event.widget, "_wb_role", None) == "titlebar"
 
     def _is_resize_grip(self, event: events.MouseEvent) -> bool:
         """Return True if the event originated from the resize grip."""
-        widget = event.widget if hasattr(event, "widget") else None
-        return isinstance(widget, _ResizeGrip)
+        return getattr(event.widget, "_wb_role", None) == "resize-grip"
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
         """Start drag or resize depending on target."""
@@ -435,59 +499,58 @@ class Window(Container):
             event.stop()
             self._resize_mouse_start = event.screen_offset
             self._resize_size_start = self._current_size()
+            self._resize_armed = False
             self.capture_mouse()
             return
 
         if self._is_titlebar_target(event):
             event.stop()
             # Double-click detection
-            now = time.monotonic()
-            if now - self._last_titlebar_click < 0.4:
-                self._last_titlebar_click = 0.0
+            now_ns = time.monotonic_ns()
+            if now_ns - self._last_titlebar_click_ns < _DOUBLE_CLICK_NS:
+                self._last_titlebar_click_ns = 0
                 self.toggle_maximize()
                 return
-            self._last_titlebar_click = now
+            self._last_titlebar_click_ns = now_ns
 
             self._drag_mouse_start = event.screen_offset
             self._drag_offset_start = self._current_offset()
+            self._drag_armed = False
+            self._drag_last_offset = None
             self.capture_mouse()
             return
 
     def on_mouse_move(self, event: events.MouseMove) -> None:
-        """Handle in-progress drag or resize."""
-        if self._resize_mouse_start is not None and self._resize_size_start is not None:
-            event.stop()
-            dx = event.screen_x - self._resize_mouse_start.x
-            dy = event.screen_y - self._resize_mouse_start.y
-            new_w = max(self._resize_size_start[0] + dx, self._min_width)
-            new_h = max(self._resize_size_start[1] + dy, self._min_height)
-            self.styles.width = new_w
-            self.styles.height = new_h
-            return
-
-        if self._drag_mouse_start is not None and self._drag_offset_start is not None:
+        """Record the pointer for an in-progress drag or resize."""
+        if self._resize_mouse_start is not None or self._drag_mouse_start is not None:
             event.stop()
-            x = self._drag_offset_start.x + (event.screen_x - self._drag_mouse_start.x)
-            y = self._drag_offset_start.y + (event.screen_y - self._drag_mouse_start.y)
-            self.styles.offset = (x, y)
-            return
+            self._latest_move = event.screen_offset
+            self._geom_dirty.set()
 
     def on_mouse_up(self, event: events.MouseUp) -> None:
         """Finish drag or resize, snap to grid."""
+        self._consume_latest_move()
         if self._resize_mouse_start is not None:
             event.stop()
+            # Apply any size still waiting for its flush.
+            self._flush_geometry()
             self._resize_mouse_start = None
             self._resize_size_start = None
+            self._resize_armed = False
             self.release_mouse()
             return
 
         if self._drag_mouse_start is not None:
             event.stop()
-            current = self._current_offset()
-            sx, sy = self._snap_to_grid(current.x, current.y)
-            self.styles.offset = (sx, sy)
+            if self._drag_last_offset is not None:
+                # Snap from the gesture's own last position rather than
+                # re-reading the styles; replaces any unflushed offset.
+                self._pending_offset = self._snap_to_grid(*self._drag_last_offset)
+            self._flush_geometry()
             self._drag_mouse_start = None
             self._drag_offset_start = None
+            self._drag_armed = False
+            self._drag_last_offset = None
             self.release_mouse()
             return
 
@@ -9,6 +9,8 @@ end, and a taskbar for minimized windows.
 from __future__ import annotations
 
 import math
+from collections import OrderedDict
+from collections.abc import ValuesView
 from enum import Enum
 
 from textual import on
@@ -21,6 +23,151 @@ from textual.widgets import Static
 from workbench.tui.window import Window, WindowState
 
 
+# ---------------------------------------------------------------------------
+# Styles
+# ---------------------------------------------------------------------------
+
+# CSS for the whole window system (windows, their chrome, the taskbar and
+# the manager).  It is registered once by the app rather than carried as
+# DEFAULT_CSS on every widget class, so mounting a window does not walk and
+# re-register per-class default CSS for each of its parts.
+WINDOW_SYSTEM_CSS = """
+_TitleBar {
+    layout: horizontal;
+    width: 1fr;
+    height: 1;
+    background: #e67e00;
+    color: #e8e8e8;
+}
+
+_TitleBar > .window-title-label {
+    width: 1fr;
+    height: 1;
+    padding: 0 1;
+    text-style: bold;
+    color: #ffffff;
+}
+
+_TitleBar > .window-btn {
+    width: 4;
+    height: 1;
+    min-width: 4;
+    text-align: center;
+    background: #e67e00;
+    color: #e8e8e8;
+}
+
+_TitleBar > .window-btn:hover {
+    background: #ff8c00;
+    color: #ffffff;
+}
+
+_TitleBar > .window-btn-close:hover {
+    background: #ef4444;
+    color: #ffffff;
+}
+
+_ResizeGrip {
+    dock: bottom;
+    width: 2;
+    height: 1;
+    content-align: right bottom;
+    color: #a0a0a0;
+}
+
+_ResizeGrip:hover {
+    color: #ff8c00;
+}
+
+_ContentArea {
+    width: 1fr;
+    height: 1fr;
+}
+
+Window {
+    position: absolute;
+    width: 60;
+    height: 20;
+    border: solid #333333;
+    background: #1a1a1a;
+    overflow: hidden;
+    layer: windows;
+}
+
+Window:focus-within {
+    border: thick #ff8c00;
+}
+
+Window.-maximized {
+    border: thick #ff8c00;
+}
+
+Window.-minimized {
+    display: none;
+}
+
+Window > ._grip-row {
+    dock: bottom;
+    height: 1;
+    width: 1fr;
+    layout: horizontal;
+}
+
+Window > ._grip-row > ._grip-spacer {
+    width: 1fr;
+    height: 1;
+}
+
+_TaskbarItem {
+    width: auto;
+    height: 1;
+    padding: 0 2;
+    background: #cc7000;
+    color: #e8e8e8;
+    margin: 0 1;
+    border: solid #333333;
+}
+
+_TaskbarItem:hover {
+    background: #ff8c00;
+    color: #ffffff;
+}
+
+Taskbar {
+    dock: bottom;
+    height: 1;
+    background: #141414;
+    layout: horizontal;
+    display: none;
+    border-top: solid #333333;
+}
+
+Taskbar.--visible {
+    display: block;
+}
+
+"""
+
+# Each raise puts the window on the next of these layers, so stacking
+# changes are a style update rather than a DOM reorder.  Textual resolves a
+# widget's layer list from its outermost ancestor declaring ``layers``, so
+# they must be declared on Screen; an app's own Screen rule must not
+# redeclare ``layers``.
+_Z_LAYER_COUNT = 64
+_Z_LAYERS = tuple(f"z{i}" for i in range(_Z_LAYER_COUNT))
+
+WINDOW_SYSTEM_CSS += f"""
+Screen {{
+    layers: default windows {" ".join(_Z_LAYERS)} context-menu menu-dropdown;
+}}
+
+WindowManager {{
+    width: 1fr;
+    height: 1fr;
+}}
+"""
+
+
 # ---------------------------------------------------------------------------
 # Window kind enum
 # ---------------------------------------------------------------------------
@@ -42,25 +189,18 @@ class WindowKind(Enum):
 class _TaskbarItem(Static):
     """A clickable label in the taskbar representing a minimized window."""
 
-    DEFAULT_CSS = """
-    _TaskbarItem {
-        width: auto;
-        height: 1;
-        padding: 0 2;
-        background: #cc7000;
-        color: #e8e8e8;
-        margin: 0 1;
-        border: solid #333333;
-    }
-    _TaskbarItem:hover {
-        background: #ff8c00;
-        color: #ffffff;
-    }
-    """
+    __slots__ = ("_title", "window_id")
 
     def __init__(self, window_id: str, title: str) -> None:
         super().__init__(f"\u25a0 {title}")
         self.window_id = window_id
+        self._title = title
+
+    def set_title(self, title: str) -> None:
+        """Update the label text if the window title changed."""
+        if title != self._title:
+            self._title = title
+            self.update(f"\u25a0 {title}")
 
     async def on_click(self, event) -> None:
         event.stop()
@@ -70,40 +210,60 @@ class _TaskbarItem(Static):
 class Taskbar(Container):
     """Docked-bottom bar showing minimized windows as clickable labels."""
 
-    DEFAULT_CSS = """
-    Taskbar {
-        dock: bottom;
-        height: 1;
-        background: #141414;
-        layout: horizontal;
-        display: none;
-        border-top: solid #333333;
-    }
-    Taskbar.--visible {
-        display: block;
-    }
-    """
-
     class RestoreRequested(Message):
         """Posted when a taskbar item is clicked to restore a window."""
 
+        __slots__ = ("window_id",)
+
         def __init__(self, window_id: str) -> None:
             super().__init__()
             self.window_id = window_id
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Mounted items keyed by window id, in display order
+        self._current_items: dict[str, _TaskbarItem] = {}
+
     def update_items(self, minimized: list[tuple[str, str]]) -> None:
-        """Rebuild taskbar with current minimized windows.
+        """Reconcile taskbar items with the current minimized windows.
+
+        Only items whose window appeared or disappeared are mounted or
+        removed; surviving items are retitled and reordered in place.
 
         Args:
             minimized: List of (window_id, title) tuples.
         """
-        self.query("_TaskbarItem").remove()
-        if minimized:
-            self.add_class("--visible")
-            for win_id, title in minimized:
-                self.mount(_TaskbarItem(win_id, title))
-        else:
-            self.remove_class("--visible")
+        current = self._current_items
+        wanted = {win_id for win_id, _ in minimized}
+
+        stale = [item for win_id, item in current.items() if win_id not in wanted]
+        if stale:
+            self.remove_children(stale)
+
+        kept = [win_id for win_id in current if win_id in wanted]
+        in_order = kept == [win_id for win_id, _ in minimized if win_id in current]
+
+        items: dict[str, _TaskbarItem] = {}
+        prev: _TaskbarItem | None = None
+        for win_id, title in minimized:
+            item = current.get(win_id)
+            if item is None:
+                item = _TaskbarItem(win_id, title)
+                if prev is not None:
+                    self.mount(item, after=prev)
+                elif kept:
+                    self.mount(item, before=current[kept[0]])
+                else:
+                    self.mount(item)
+            else:
+                item.set_title(title)
+                if not in_order and prev is not None:
+                    self.move_child(item, after=prev)
+            items[win_id] = item
+            prev = item
+        self._current_items = items
+
+        self.set_class(bool(minimized), "--visible")
 
 
 # ---------------------------------------------------------------------------
@@ -120,17 +280,11 @@ class WindowManager(Container):
         WindowManager.ActiveWindowChanged -- when the focused window changes.
     """
 
-    DEFAULT_CSS = """
-    WindowManager {
-        width: 1fr;
-        height: 1fr;
-        layers: default windows context-menu menu-dropdown;
-    }
-    """
-
     class ActiveWindowChanged(Message):
         """Posted when the active (focused) window changes."""
 
+        __slots__ = ("window",)
+
         def __init__(self, window: Window | None) -> None:
             super().__init__()
             self.window = window
@@ -143,6 +297,10 @@ class WindowManager(Container):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._windows: dict[str, Window] = {}
+        # Windows from bottom to top of the stacking order
+        self._z_order: OrderedDict[str, Window] = OrderedDict()
+        self._minimized_ids: set[str] = set()
+        self._visible_cache: tuple[Window, ...] | None = None
         self._taskbar = Taskbar()
 
     def compose(self) -> ComposeResult:
@@ -162,10 +320,14 @@ class WindowManager(Container):
             window.id = win_id
 
         self._windows[win_id] = window
+        self._visible_cache = None
+        # A synchronous watcher, unlike the posted StateChanged message, drops
+        # the cache before a layout call in the same handler can read it.
+        self.watch(window, "window_state", self._invalidate_visible, init=False)
         self.mount(window, before=self._taskbar)
 
         if offset is not None:
-            window.styles.offset = offset
+            window._write_offset(offset)
 
         self.bring_to_front(win_id)
 
@@ -174,40 +336,75 @@ class WindowManager(Container):
         window = self._windows.pop(win_id, None)
         if window is None:
             return
+        self._visible_cache = None
+        self._z_order.pop(win_id, None)
         window.remove()
         if self.active_window is window:
-            # Activate the next available window
-            remaining = [w for w in self._windows.values()
-                         if w.window_state != WindowState.MINIMIZED]
-            self.active_window = remaining[-1] if remaining else None
-        self._refresh_taskbar()
+            # Activate the topmost window that is still visible
+            self.active_window = None
+            for other in reversed(self._z_order.values()):
+                if other.window_state != WindowState.MINIMIZED:
+                    self.active_window = other
+                    break
+        if win_id in self._minimized_ids:
+            self._minimized_ids.discard(win_id)
+            self._refresh_taskbar()
 
     def bring_to_front(self, win_id: str) -> None:
         """Raise a window to the top of the z-order."""
         window = self._windows.get(win_id)
         if window is None:
             return
+        z_order = self._z_order
+        if next(reversed(z_order), None) == win_id:
+            if self.active_window is not window:
+                self.active_window = window
+            return
+        z_order[win_id] = window
+        z_order.move_to_end(win_id)
         self._z_counter += 1
-        # Reorder the window DOM node to be last (highest z) before the taskbar.
-        # Using move_child instead of remove/mount preserves the widget tree
-        # so that children (compose results) are not destroyed and recreated.
-        self.move_child(window, before=self._taskbar)
+        if self._z_counter < _Z_LAYER_COUNT:
+            window.styles.layer = _Z_LAYERS[self._z_counter]
+        else:
+            self._compact_layers()
         self.active_window = window
 
+    def _compact_layers(self) -> None:
+        """Reassign stacking layers bottom-to-top once the counter runs out."""
+        top = _Z_LAYER_COUNT - 1
+        for i, window in enumerate(self._z_order.values()):
+            window.styles.layer = _Z_LAYERS[min(i, top)]
+        self._z_counter = min(len(self._z_order), _Z_LAYER_COUNT) - 1
+        if len(self._z_order) > _Z_LAYER_COUNT:
+            # Windows past the last layer share it and stack in DOM order.
+            # Reorder the window DOM node to be last (highest z) before the taskbar.
+            # Using move_child instead of remove/mount preserves the widget tree
+            # so that children (compose results) are not destroyed and recreated.
+            top_window = next(reversed(self._z_order.values()))
+            self.move_child(top_window, before=self._taskbar)
+
     def get_window(self, win_id: str) -> Window | None:
         """Look up a window by ID."""
         return self._windows.get(win_id)
 
     @property
-    def windows(self) -> list[Window]:
-        """All managed windows."""
-        return list(self._windows.values())
+    def windows(self) -> ValuesView[Window]:
+        """All managed windows (a live view, not a copy)."""
+        return self._windows.values()
 
     @property
-    def visible_windows(self) -> list[Window]:
-        """Windows that are not minimized."""
-        return [w for w in self._windows.values()
-                if w.window_state != WindowState.MINIMIZED]
+    def visible_windows(self) -> tuple[Window, ...]:
+        """Windows that are not minimized.
+
+        Cached until a window is opened, closed or changes state.
+        """
+        if self._visible_cache is None:
+            self._visible_cache = tuple(w for w in self._windows.values()
+                                        if w.window_state != WindowState.MINIMIZED)
+        return self._visible_cache
+
+    def _invalidate_visible(self) -> None:
+        self._visible_cache = None
 
     # -- Reactive watchers -----------------------------------------------------
 
@@ -233,6 +430,17 @@ class WindowManager(Container):
     @on(Window.StateChanged)
     def _on_window_state_changed(self, event: Window.StateChanged) -> None:
         event.stop()
+        minimized = WindowState.MINIMIZED.value
+        if event.state != minimized and event.old_state != minimized:
+            # Maximize/restore transitions don't change the taskbar
+            return
+        win_id = event.window.id
+        if not win_id or win_id not in self._windows:
+            return
+        if event.state == minimized:
+            self._minimized_ids.add(win_id)
+        else:
+            self._minimized_ids.discard(win_id)
         self._refresh_taskbar()
 
     @on(Taskbar.RestoreRequested)
@@ -247,11 +455,12 @@ class WindowManager(Container):
 
     def _refresh_taskbar(self) -> None:
         """Update the taskbar with currently minimized windows."""
+        minimized_ids = self._minimized_ids
         minimized = [
-            (w.id or "", w.window_title)
-            for w in self._windows.values()
-            if w.window_state == WindowState.MINIMIZED
-        ]
+            (win_id, self._windows[win_id].window_title)
+            for win_id in self._windows
+            if win_id in minimized_ids
+        ] if minimized_ids else []
         self._taskbar.update_items(minimized)
 
     def toggle_taskbar(self) -> None:
@@ -267,6 +476,16 @@ class WindowManager(Container):
         """Return the usable (width, height) of the manager area."""
         return (self.size.width, self.size.height - 1)  # -1 for taskbar
 
+    def _apply_geometry(self, window: Window, x: int, y: int, w: int, h: int) -> None:
+        """Set a window's offset and size.
+
+        Values the window already has are not written again.  Callers
+        wrap their loop in ``app.batch_update()`` so all windows are
+        laid out in one pass.
+        """
+        window._write_offset((x, y))
+        window._write_size((w, h))
+
     def cascade(self) -> None:
         """Arrange visible windows in a cascading pattern."""
         visible = self.visible_windows
@@ -275,14 +494,13 @@ class WindowManager(Container):
         w, h = self._workspace_size()
         win_w = max(int(w * 0.6), 30)
         win_h = max(int(h * 0.6), 10)
-        for i, window in enumerate(visible):
-            if window.window_state == WindowState.MAXIMIZED:
-                window.restore()
-            x = (i * 4) % max(w - win_w, 1)
-            y = (i * 2) % max(h - win_h, 1)
-            window.styles.offset = (x, y)
-            window.styles.width = win_w
-            window.styles.height = win_h
+        with self.app.batch_update():
+            for i, window in enumerate(visible):
+                if window.window_state == WindowState.MAXIMIZED:
+                    window.restore()
+                x = (i * 4) % max(w - win_w, 1)
+                y = (i * 2) % max(h - win_h, 1)
+                self._apply_geometry(window, x, y, win_w, win_h)
 
     def tile_horizontal(self) -> None:
         """Stack visible windows top-to-bottom, full width."""
@@ -291,12 +509,11 @@ class WindowManager(Container):
             return
         w, h = self._workspace_size()
         each_h = max(h // len(visible), 6)
-        for i, window in enumerate(visible):
-            if window.window_state == WindowState.MAXIMIZED:
-                window.restore()
-            window.styles.offset = (0, i * each_h)
-            window.styles.width = w
-            window.styles.height = each_h
+        with self.app.batch_update():
+            for i, window in enumerate(visible):
+                if window.window_state == WindowState.MAXIMIZED:
+                    window.restore()
+                self._apply_geometry(window, 0, i * each_h, w, each_h)
 
     def tile_vertical(self) -> None:
         """Stack visible windows left-to-right, full height."""
@@ -305,12 +522,11 @@ class WindowManager(Container):
             return
         w, h = self._workspace_size()
         each_w = max(w // len(visible), 20)
-        for i, window in enumerate(visible):
-            if window.window_state == WindowState.MAXIMIZED:
-                window.restore()
-            window.styles.offset = (i * each_w, 0)
-            window.styles.width = each_w
-            window.styles.height = h
+        with self.app.batch_update():
+            for i, window in enumerate(visible):
+                if window.window_state == WindowState.MAXIMIZED:
+                    window.restore()
+                self._apply_geometry(window, i * each_w, 0, each_w, h)
 
     def tile_grid(self) -> None:
         """Arrange visible windows in an auto-calculated grid."""
@@ -326,11 +542,10 @@ class WindowManager(Container):
         cell_w = max(w // cols, 20)
         cell_h = max(h // rows, 6)
 
-        for i, window in enumerate(visible):
-            if window.window_state == WindowState.MAXIMIZED:
-                window.restore()
-            row = i // cols
-            col = i % cols
-            window.styles.offset = (col * cell_w, row * cell_h)
-            window.styles.width = cell_w
-            window.styles.height = cell_h
+        with self.app.batch_update():
+            for i, window in enumerate(visible):
+                if window.window_state == WindowState.MAXIMIZED:
+                    window.restore()
+                row = i // cols
+                col = i % cols
+                self._apply_geometry(window, col * cell_w, row * cell_h, cell_w, cell_h)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import Any
 
@@ -37,20 +38,25 @@ class ArtifactsWindowContent(Vertical):
     def __init__(self, artifact_store: Any = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.artifact_store = artifact_store
+        self._table = DataTable(id="artifacts-table")
+        self._detail = RichLog(id="artifact-detail", wrap=True, highlight=True, markup=True)
+        # Shard name -> (shard mtime_ns, [(sha, size), ...]).  Artifacts are
+        # immutable, so a shard only needs rescanning when its mtime moves.
+        self._dir_cache: dict[str, tuple[int, list[tuple[str, int]]]] = {}
 
     def compose(self) -> ComposeResult:
-        yield DataTable(id="artifacts-table")
-        yield RichLog(id="artifact-detail", wrap=True, highlight=True, markup=True)
+        yield self._table
+        yield self._detail
 
     def on_mount(self) -> None:
-        table = self.query_one("#artifacts-table", DataTable)
+        table = self._table
         table.add_columns("SHA256 (short)", "Name", "Size", "Type")
         table.cursor_type = "row"
         self.refresh_artifacts()
 
     def refresh_artifacts(self) -> None:
         """Scan the artifact store and populate the table."""
-        table = self.query_one("#artifacts-table", DataTable)
+        table = self._table
         table.clear()
         if self.artifact_store is None:
             return
@@ -59,23 +65,45 @@ class ArtifactsWindowContent(Vertical):
         if not base.exists():
             return
 
-        for subdir in sorted(base.iterdir()):
-            if not subdir.is_dir() or len(subdir.name) != 2:
-                continue
-            for artifact_file in sorted(subdir.iterdir()):
-                if artifact_file.is_file() and not artifact_file.suffix:
-                    sha = artifact_file.name
-                    size = artifact_file.stat().st_size
-                    size_str = self._format_size(size)
-                    table.add_row(
-                        sha[:12] + "...",
-                        artifact_file.name,
-                        size_str,
-                        "binary",
-                        key=sha,
-                    )
+        # Artifacts live at <base>/<first two hex chars>/<sha256>.  scandir
+        # hands back type and stat info from the directory listing itself.
+        old_cache = self._dir_cache
+        new_cache: dict[str, tuple[int, list[tuple[str, int]]]] = {}
+        found: list[tuple[str, int]] = []
+        with os.scandir(base) as subdirs:
+            for subdir in subdirs:
+                if len(subdir.name) != 2 or not subdir.is_dir(follow_symlinks=False):
+                    continue
+                mtime_ns = subdir.stat(follow_symlinks=False).st_mtime_ns
+                cached = old_cache.get(subdir.name)
+                if cached is not None and cached[0] == mtime_ns:
+                    rows = cached[1]
+                else:
+                    rows = []
+                    with os.scandir(subdir.path) as entries:
+                        for entry in entries:
+                            if "." not in entry.name and entry.is_file(follow_symlinks=False):
+                                rows.append((entry.name, entry.stat().st_size))
+                new_cache[subdir.name] = (mtime_ns, rows)
+                found.extend(rows)
+        self._dir_cache = new_cache
+
+        # A sha's subdirectory is its own prefix, so one sort by name
+        # reproduces the per-directory ordering.
+        found.sort()
+        # add_rows() can't take row keys, so add keyed rows under one batch.
+        with self.app.batch_update():
+            for sha, size in found:
+                table.add_row(
+                    sha[:12] + "...",
+                    sha,
+                    self._format_size(size),
+                    "binary",
+                    key=sha,
+                )
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _format_size(size: int) -> str:
         for unit in ("B", "KB", "MB", "GB"):
             if size < 1024:
@@ -85,7 +113,7 @@ class ArtifactsWindowContent(Vertical):
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Show artifact preview when a row is selected."""
-        detail = self.query_one("#artifact-detail", RichLog)
+        detail = self._detail
         detail.clear()
         if self.artifact_store is None or event.row_key is None:
             return
@@ -103,7 +131,8 @@ class ArtifactsWindowContent(Vertical):
 
         # Try to show content preview (first 500 bytes as text)
         try:
-            raw = path.read_bytes()[:500]
+            with path.open("rb") as f:
+                raw = f.read(500)
             text = raw.decode("utf-8", errors="replace")
             detail.write(f"\n[bold]Preview:[/bold]\n{text}")
         except Exception as e:
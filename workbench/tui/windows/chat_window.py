@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any, Callable
 
+from rich.highlighter import ReprHighlighter
 from rich.markup import escape
+from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -19,6 +22,38 @@ _log = logging.getLogger("workbench.tui.chat")
 
 _COPY_FILE = Path.home() / ".workbench" / "last_response.txt"
 
+# Streamed text is written to the log a line at a time; a line longer than
+# this is broken at a space so long paragraphs still appear progressively.
+_STREAM_FLUSH_CHARS = 1024
+
+# Deltas queued between the orchestrator and the log writer before the
+# orchestrator has to wait for rendering to catch up.
+_STREAM_QUEUE_SIZE = 64
+
+_ASSISTANT_HEADER = "\n[bold #10b981]Assistant:[/bold #10b981]"
+
+# Static messages, parsed and highlighted once here rather than on every
+# write; this matches what RichLog does with a markup string.
+_highlight = ReprHighlighter()
+_BANNER = _highlight(Text.from_markup(
+    "[bold #ff8c00]Workbench Chat[/bold #ff8c00]\n"
+    "[dim]Type a message to begin. Use /help for commands.[/dim]\n"
+))
+_HELP_TEXT = _highlight(Text.from_markup(
+    "[bold]Commands:[/bold]\n"
+    "  /help     - Show this help\n"
+    "  /clear    - Clear chat\n"
+    "  /copy     - Copy last response to file + clipboard\n"
+    "  /save     - Save full chat to file\n"
+    "  /switch   - Switch LLM provider\n"
+))
+_CLEARED = _highlight(Text.from_markup("[dim]Chat cleared.[/dim]\n"))
+
+
+def _write_copy_file(text: str) -> None:
+    _COPY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _COPY_FILE.write_text(text)
+
 
 class ChatWindowContent(Vertical):
     """Chat interface with streaming LLM output.
@@ -66,17 +101,19 @@ class ChatWindowContent(Vertical):
         self.router = router
         self.registry = registry
         self._last_response: str = ""
-        self._chat_history: list[str] = []
+        # Entries are stored encoded so /save can stream them out as-is
+        self._chat_history: list[bytes] = []
+        self._chat_log = RichLog(id="chat-log", wrap=True, highlight=True, markup=True)
+        self._input = Input(placeholder="Type a message...", id="chat-input")
 
     def compose(self) -> ComposeResult:
-        yield RichLog(id="chat-log", wrap=True, highlight=True, markup=True)
-        yield Input(placeholder="Type a message...", id="chat-input")
+        yield self._chat_log
+        yield self._input
 
     def on_mount(self) -> None:
-        log = self.query_one("#chat-log", RichLog)
-        log.write("[bold #ff8c00]Workbench Chat[/bold #ff8c00]")
-        log.write("[dim]Type a message to begin. Use /help for commands.[/dim]\n")
-        self.query_one("#chat-input", Input).focus()
+        log = self._chat_log
+        log.write(_BANNER)
+        self._input.focus()
 
     @on(Input.Submitted, "#chat-input")
     async def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -84,16 +121,15 @@ class ChatWindowContent(Vertical):
         if not user_input:
             return
 
-        input_widget = self.query_one("#chat-input", Input)
-        input_widget.value = ""
+        self._input.value = ""
 
         if user_input.startswith("/"):
             await self._handle_command(user_input)
             return
 
-        log = self.query_one("#chat-log", RichLog)
+        log = self._chat_log
         log.write(f"\n[bold #ff8c00]You:[/bold #ff8c00] {escape(user_input)}")
-        self._chat_history.append(f"you> {user_input}")
+        self._chat_history.append(f"you> {user_input}".encode())
 
         if self.orchestrator:
             self._run_orchestrator(user_input)
@@ -109,9 +145,18 @@ class ChatWindowContent(Vertical):
         would create a separate event loop and deadlock on the first DB write.
         """
         _log.info("orchestrator start: %s", user_input[:80])
-        log = self.query_one("#chat-log", RichLog)
+        log = self._chat_log
+
+        # Deltas are handed to a separate writer task so a slow render only
+        # holds up the orchestrator once the queue is full.
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        writer = asyncio.create_task(self._drain_stream(queue, log))
 
         content_parts: list[str] = []
+        # Deltas are joined here and queued a line at a time, since the
+        # writer can't show an unfinished line anyway.
+        pending: list[str] = []
+        pending_len = 0
         chunk_count = 0
         try:
             async for chunk in self.orchestrator.run(user_input):
@@ -124,14 +169,26 @@ class ChatWindowContent(Vertical):
                         chunk.done,
                     )
                     content_parts.append(chunk.delta)
+                    pending.append(chunk.delta)
+                    pending_len += len(chunk.delta)
+                    if "\n" in chunk.delta or pending_len >= _STREAM_FLUSH_CHARS:
+                        await queue.put("".join(pending))
+                        pending = []
+                        pending_len = 0
                 if chunk.done:
                     _log.info("chunk %d: DONE", chunk_count)
                     break
+        except asyncio.CancelledError:
+            writer.cancel()
+            raise
         except Exception as e:
             _log.exception("orchestrator error: %s", e)
+            await self._end_stream(queue, writer, "".join(pending))
             log.write(f"[red]Error: {escape(str(e))}[/red]")
             return
 
+        await self._end_stream(queue, writer, "".join(pending))
+
         _log.info(
             "orchestrator finished: %d chunks, %d content parts",
             chunk_count,
@@ -139,31 +196,84 @@ class ChatWindowContent(Vertical):
         )
 
         if content_parts:
+            log.write("")
             full_text = "".join(content_parts)
             self._last_response = full_text
-            self._chat_history.append(f"assistant> {full_text}")
-            log.write(f"\n[bold #10b981]Assistant:[/bold #10b981]\n{escape(full_text)}\n")
+            self._chat_history.append(f"assistant> {full_text}".encode())
         else:
-            log.write(
-                "\n[bold #10b981]Assistant:[/bold #10b981] [yellow](no response)[/yellow]"
-            )
+            log.write(f"{_ASSISTANT_HEADER} [yellow](no response)[/yellow]")
+
+    async def _drain_stream(self, queue: asyncio.Queue[str | None], log: RichLog) -> None:
+        """Write streamed deltas from *queue* to *log* until ``None`` arrives.
+
+        Everything already queued is taken on each wake-up, so when rendering
+        falls behind the backlog goes out in one write rather than one per
+        delta.  The unfinished last line is held back (see
+        ``_write_complete_lines``) and written when the stream ends.
+        """
+        pending = ""
+        started = False
+        done = False
+        while not done:
+            parts = [await queue.get()]
+            while not queue.empty():
+                parts.append(queue.get_nowait())
+            if parts[-1] is None:
+                parts.pop()
+                done = True
+            if parts and not started:
+                log.write(_ASSISTANT_HEADER)
+                started = True
+            text = pending + "".join(parts)
+            if done:
+                if text:
+                    log.write(escape(text))
+            elif "\n" in text or len(text) >= _STREAM_FLUSH_CHARS:
+                pending = self._write_complete_lines(log, text)
+            else:
+                pending = text
+
+    @staticmethod
+    async def _end_stream(
+        queue: asyncio.Queue[str | None], writer: asyncio.Task, rest: str
+    ) -> None:
+        """Queue *rest*, signal the end of the stream and wait for the writer."""
+        if rest:
+            await queue.put(rest)
+        await queue.put(None)
+        await writer
+
+    @staticmethod
+    def _write_complete_lines(log: RichLog, text: str) -> str:
+        """Write the finished lines of streamed text and return the rest.
+
+        RichLog starts a new line on every write, so only text up to the
+        last newline is written.  Text with no newline that has grown past
+        ``_STREAM_FLUSH_CHARS`` is broken at its last space instead.
+
+        Markup is escaped here, one written line at a time, rather than per
+        delta: a ``[tag]``-like sequence split across two deltas would get
+        past a per-delta escape and be rendered as markup once joined.
+        """
+        head, sep, tail = text.rpartition("\n")
+        if not sep:
+            if len(text) < _STREAM_FLUSH_CHARS:
+                return text
+            head, sep, tail = text.rpartition(" ")
+            if not sep:
+                head, tail = text, ""
+        log.write(escape(head))
+        return tail
 
     async def _handle_command(self, command: str) -> None:
-        log = self.query_one("#chat-log", RichLog)
+        log = self._chat_log
         parts = command.strip().split(None, 1)
         cmd = parts[0].lower()
 
         if cmd == "/help":
-            log.write(
-                "[bold]Commands:[/bold]\n"
-                "  /help     - Show this help\n"
-                "  /clear    - Clear chat\n"
-                "  /copy     - Copy last response to file + clipboard\n"
-                "  /save     - Save full chat to file\n"
-                "  /switch   - Switch LLM provider\n"
-            )
+            log.write(_HELP_TEXT)
         elif cmd == "/copy":
-            self._copy_last_response()
+            self.run_worker(self._copy_last_response(), thread=False)
         elif cmd == "/save":
             save_path = parts[1].strip() if len(parts) > 1 else str(Path.home() / ".workbench" / "chat_log.txt")
             self._save_chat(save_path)
@@ -187,42 +297,55 @@ class ChatWindowContent(Vertical):
         else:
             log.write(f"[red]Unknown command: {cmd}[/red]")
 
-    def _copy_last_response(self) -> None:
-        """Copy last assistant response to file and attempt clipboard."""
-        log = self.query_one("#chat-log", RichLog)
-        if not self._last_response:
+    async def _copy_last_response(self) -> None:
+        """Copy last assistant response to file and attempt clipboard.
+
+        Runs as a worker; the file write and xclip both happen off the
+        event loop's critical path.
+        """
+        log = self._chat_log
+        text = self._last_response
+        if not text:
             log.write("[yellow]No response to copy.[/yellow]")
             return
-        _COPY_FILE.parent.mkdir(parents=True, exist_ok=True)
-        _COPY_FILE.write_text(self._last_response)
+        await asyncio.to_thread(_write_copy_file, text)
         log.write(f"[green]Response saved to {_COPY_FILE}[/green]")
+        proc = None
         try:
-            import subprocess
-            subprocess.run(
-                ["xclip", "-selection", "clipboard"],
-                input=self._last_response.encode(),
-                timeout=2,
-                capture_output=True,
+            proc = await asyncio.create_subprocess_exec(
+                "xclip", "-selection", "clipboard",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
+            await asyncio.wait_for(proc.communicate(text.encode()), timeout=2)
             log.write("[green]Copied to clipboard.[/green]")
         except Exception:
-            pass
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
 
     def _save_chat(self, path: str) -> None:
         """Save full chat history to a file."""
-        log = self.query_one("#chat-log", RichLog)
+        log = self._chat_log
         if not self._chat_history:
             log.write("[yellow]No chat history to save.[/yellow]")
             return
         save_path = Path(path)
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        save_path.write_text("\n\n".join(self._chat_history) + "\n")
+        # Write entry by entry rather than joining the whole chat first
+        with save_path.open("wb") as f:
+            for i, entry in enumerate(self._chat_history):
+                if i:
+                    f.write(b"\n\n")
+                f.write(entry)
+            f.write(b"\n")
         log.write(f"[green]Chat saved to {save_path}[/green]")
 
     def clear_chat(self) -> None:
-        log = self.query_one("#chat-log", RichLog)
+        log = self._chat_log
         log.clear()
-        log.write("[dim]Chat cleared.[/dim]\n")
+        log.write(_CLEARED)
 
     # -- Menu protocol ---------------------------------------------------------
 
@@ -230,7 +353,7 @@ class ChatWindowContent(Vertical):
         return [
             MenuItem("Clear Chat", callback=self.clear_chat),
             MenuItem(separator=True),
-            MenuItem("Focus Input", callback=lambda: self.query_one("#chat-input", Input).focus()),
+            MenuItem("Focus Input", callback=lambda: self._input.focus()),
         ]
 
     def get_menu_bar_sections(self) -> list[MenuSection]:
@@ -13,6 +13,19 @@ from textual.widgets import RichLog
 from workbench.tui.context_menu import MenuItem
 from workbench.tui.menu_bar import MenuAction, MenuSection
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+
+def _render_json(data: Any) -> str:
+    """Pretty-print *data* as two-space indented JSON."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=str, option=option).decode()
+    return json.dumps(data, indent=2, default=str)
+
 
 class ConfigWindowContent(Vertical):
     """Display the current effective configuration.
@@ -33,15 +46,20 @@ class ConfigWindowContent(Vertical):
     def __init__(self, config: Any = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.config = config
+        self._config_log = RichLog(id="config-log", wrap=True, highlight=True, markup=True)
+        # (config dict, rendered JSON) from the last render.  Keyed on the
+        # dict contents, so Reload picks up in-place edits to the config
+        # and only skips the JSON render when nothing changed.
+        self._cached_render: tuple[dict, str] | None = None
 
     def compose(self) -> ComposeResult:
-        yield RichLog(id="config-log", wrap=True, highlight=True, markup=True)
+        yield self._config_log
 
     def on_mount(self) -> None:
         self.show_config()
 
     def show_config(self) -> None:
-        log = self.query_one("#config-log", RichLog)
+        log = self._config_log
         log.clear()
         log.write("[bold]Effective Configuration[/bold]\n")
         if self.config is None:
@@ -49,7 +67,12 @@ class ConfigWindowContent(Vertical):
             return
         try:
             d = self.config.to_dict() if hasattr(self.config, "to_dict") else asdict(self.config)
-            formatted = json.dumps(d, indent=2, default=str)
+            cached = self._cached_render
+            if cached is not None and cached[0] == d:
+                formatted = cached[1]
+            else:
+                formatted = _render_json(d)
+                self._cached_render = (d, formatted)
             log.write(formatted)
         except Exception as e:
             log.write(f"[red]Error displaying config: {e}[/red]")
@@ -5,6 +5,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
+from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import RichLog
@@ -12,6 +14,18 @@ from textual.widgets import RichLog
 from workbench.tui.context_menu import MenuItem
 from workbench.tui.menu_bar import MenuAction, MenuSection
 
+_RISK_COLORS = {
+    "READ_ONLY": "green",
+    "WRITE": "yellow",
+    "DESTRUCTIVE": "red",
+    "SHELL": "bold red",
+}
+
+# Most events Show History (and the initial tail) will write at once
+_HISTORY_LIMIT = 20
+
+_CLEARED = Text.from_markup("[dim]Events cleared.[/dim]\n")
+
 
 class EventsWindowContent(Vertical):
     """Session events log viewer.
@@ -41,51 +55,79 @@ class EventsWindowContent(Vertical):
         self.session = session
         self.router = router
         self.registry = registry
+        self._events_log = RichLog(id="events-log", wrap=True, highlight=True, markup=True)
 
     def compose(self) -> ComposeResult:
-        yield RichLog(id="events-log", wrap=True, highlight=True, markup=True)
+        yield self._events_log
 
     def on_mount(self) -> None:
-        log = self.query_one("#events-log", RichLog)
+        log = self._events_log
         if self.session and self.session.session_id:
             log.write(f"[dim]Session: {self.session.session_id[:8]}...[/dim]")
         if self.router and self.router.active_name:
             log.write(f"[dim]Provider: {self.router.active_name}[/dim]")
         log.write("")
+        if self.session and self.session.session_id:
+            self._tail_events()
+
+    @work(thread=False, exclusive=True, group="events-tail")
+    async def _tail_events(self) -> None:
+        """Show the latest events, then each new one as it is stored."""
+        session_id = self.session.session_id
+        store = self.session.store
+        log = self._events_log
+        events = await store.get_events(session_id, limit=_HISTORY_LIMIT)
+        with self.app.batch_update():
+            for ev in events:
+                log.write(self._format_event(ev))
+        after = events[-1].event_id if events else None
+        async for ev in store.tail_events(session_id, after_event_id=after):
+            log.write(self._format_event(ev))
+
+    @staticmethod
+    def _format_event(ev: Any) -> str:
+        ts = ev.timestamp.strftime("%H:%M:%S") if isinstance(ev.timestamp, datetime) else str(ev.timestamp)
+        return f"[dim]{ts}[/dim] {ev.event_type}"
 
     def write_event(self, text: str) -> None:
         """Append an event line to the log."""
-        log = self.query_one("#events-log", RichLog)
-        log.write(text)
+        self._events_log.write(text)
 
     def clear_events(self) -> None:
-        log = self.query_one("#events-log", RichLog)
+        log = self._events_log
         log.clear()
-        log.write("[dim]Events cleared.[/dim]\n")
+        log.write(_CLEARED)
 
     async def show_history(self) -> None:
-        """Load and display recent session events."""
-        log = self.query_one("#events-log", RichLog)
+        """Load and display the most recent session events."""
+        log = self._events_log
         if not self.session or not self.session.session_id:
             log.write("[red]No active session.[/red]")
             return
-        events = await self.session.store.get_events(self.session.session_id)
-        for ev in events[-20:]:
-            ts = ev.timestamp.strftime("%H:%M:%S") if isinstance(ev.timestamp, datetime) else str(ev.timestamp)
-            log.write(f"[dim]{ts}[/dim] {ev.event_type}")
+        events = await self.session.store.get_events(
+            self.session.session_id, limit=_HISTORY_LIMIT,
+        )
+        with self.app.batch_update():
+            for ev in events:
+                log.write(self._format_event(ev))
 
     def show_tools(self) -> None:
         """Display registered tools in the events log."""
-        log = self.query_one("#events-log", RichLog)
+        log = self._events_log
         if not self.registry:
             log.write("[red]No registry configured.[/red]")
             return
-        tools = self.registry.list()
-        log.write("[bold]Registered Tools:[/bold]")
-        risk_colors = {"READ_ONLY": "green", "WRITE": "yellow", "DESTRUCTIVE": "red", "SHELL": "bold red"}
-        for t in tools:
-            color = risk_colors.get(t.risk_level.name, "white")
-            log.write(f"  [{color}]{t.risk_level.name:10s}[/{color}] {t.name} - {t.description[:50]}")
+        # Rows are built as styled Text, skipping the markup parser, and
+        # written in one go rather than a refresh per tool
+        lines = [Text("Registered Tools:", style="bold")]
+        for t in self.registry.list():
+            risk = t.risk_level.name
+            lines.append(Text.assemble(
+                "  ",
+                (f"{risk:10s}", _RISK_COLORS.get(risk, "white")),
+                f" {t.name} - {t.description[:50]}",
+            ))
+        log.write(Text("\n").join(lines))
         log.write("")
 
     # -- Menu protocol ---------------------------------------------------------
@@ -9,6 +9,7 @@ from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import DataTable, RichLog
 
+from workbench.tools.base import ToolRisk
 from workbench.tui.context_menu import MenuItem
 from workbench.tui.menu_bar import MenuAction, MenuSection
 
@@ -38,32 +39,39 @@ class ToolsWindowContent(Vertical):
         super().__init__(**kwargs)
         self.registry = registry
         self._current_filter: str | None = None
+        # Filtered tool lists keyed by filter; cleared by refresh_tools()
+        self._list_cache: dict[str | None, list] = {}
+        self._table = DataTable(id="tools-table")
+        self._detail = RichLog(id="tool-detail", wrap=True, highlight=True, markup=True)
 
     def compose(self) -> ComposeResult:
-        yield DataTable(id="tools-table")
-        yield RichLog(id="tool-detail", wrap=True, highlight=True, markup=True)
+        yield self._table
+        yield self._detail
 
     def on_mount(self) -> None:
-        table = self.query_one("#tools-table", DataTable)
+        table = self._table
         table.add_columns("Name", "Risk", "Description")
         table.cursor_type = "row"
         self._populate_table()
 
     def _populate_table(self) -> None:
-        table = self.query_one("#tools-table", DataTable)
+        table = self._table
         table.clear()
         if not self.registry:
             return
-        tools = self.registry.list()
-        for t in tools:
-            if self._current_filter and t.risk_level.name != self._current_filter:
-                continue
-            risk_display = t.risk_level.name
-            table.add_row(t.name, risk_display, t.description[:60], key=t.name)
+        tools = self._list_cache.get(self._current_filter)
+        if tools is None:
+            risk = ToolRisk[self._current_filter] if self._current_filter else None
+            tools = self._list_cache[self._current_filter] = self.registry.list(risk_level=risk)
+        # add_rows() can't take row keys, so add keyed rows under one batch.
+        with self.app.batch_update():
+            for t in tools:
+                risk_display = t.risk_level.name
+                table.add_row(t.name, risk_display, t.description[:60], key=t.name)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Show tool schema when a row is selected."""
-        detail = self.query_one("#tool-detail", RichLog)
+        detail = self._detail
         detail.clear()
         if not self.registry or event.row_key is None:
             return
@@ -79,6 +87,7 @@ class ToolsWindowContent(Vertical):
 
     def refresh_tools(self) -> None:
         self._current_filter = None
+        self._list_cache.clear()
         self._populate_table()
 
     def filter_read_only(self) -> None:
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
+from enum import StrEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactPayload:
     content: bytes
     original_name: str = ""
@@ -9,7 +10,7 @@ class ArtifactPayload:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactRef:
     sha256: str
     stored_path: str
@@ -19,7 +20,7 @@ class ArtifactRef:
     size_bytes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     success: bool
     content: str
@@ -31,7 +32,7 @@ class ToolResult:
     metadata: dict = field(default_factory=dict)
 
 
-class ErrorCode:
+class ErrorCode(StrEnum):
     VALIDATION_ERROR = "validation_error"
     POLICY_BLOCK = "policy_block"
     TIMEOUT = "timeout"
@@ -42,14 +43,14 @@ class ErrorCode:
     LLM_PROTOCOL_ERROR = "llm_protocol_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDecision:
     allowed: bool
     reason: str
     requires_confirmation: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextPackReport:
     max_context_tokens: int
     max_output_tokens: int